@@ -0,0 +1,65 @@
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+import scipy.sparse as sp
+
+
+# Отпечаток матрицы: хэш от формы и всех чисел.
+# У разреженной хэшируем CSR-представление (с отсортированными индексами, чтобы
+# одна и та же матрица всегда давала один и тот же ключ).
+def matrixFingerprint(A):
+    h = hashlib.blake2b(digest_size=16)
+    if sp.issparse(A):
+        A = sp.csr_matrix(A, dtype=float)
+        A.sum_duplicates()
+        A.sort_indices()
+        h.update(b"csr" + repr(A.shape).encode())
+        for arr in (A.indptr, A.indices, A.data):
+            h.update(np.ascontiguousarray(arr).data)
+    else:
+        A = np.ascontiguousarray(A, dtype=float)
+        h.update(b"dense" + repr(A.shape).encode())
+        h.update(A.data)
+    return h.hexdigest()
+
+
+# Кэш решений для почти одинаковых систем (та же A, немного другая b).
+# По отпечатку матрицы храним перестановку строк и последнее решение,
+# старые записи вытесняются по LRU, когда их больше maxsize.
+class SolutionCache:
+
+    def __init__(self, maxsize=32):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """
+        :return: (rows, x) для этой матрицы или None, если её ещё не решали
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return entry
+
+    def put(self, key, rows, x):
+        self.entries[key] = (rows, x.copy())
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __repr__(self):
+        return f"SolutionCache(hits={self.hits}, misses={self.misses}, size={len(self)}/{self.maxsize})"
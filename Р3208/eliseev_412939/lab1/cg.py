@@ -0,0 +1,66 @@
+import numpy as np
+import scipy.sparse as sp
+
+from permutation import notDominantRows
+
+
+# Метод сопряжённых градиентов для симметричных положительно определённых A.
+# Нужно только умножение A @ p, поэтому A может быть и плотной, и разреженной.
+# С precondition=True используется диагональный предобуславливатель (Якоби): z = r / diag(A).
+# Останавливаемся, когда max|r| < prec (если уже в x0 — сразу, 0 итераций). Возвращает (x, число итераций) как solveSomehow.
+def conjugateGradient(A, b, prec, maxSteps=1000, precondition=True, x0=None):
+    b = np.asarray(b, dtype=float)
+    n = b.shape[0]
+    invDiag = 1 / A.diagonal() if precondition else np.ones(n)
+
+    x = np.zeros(n, dtype=float) if x0 is None else np.array(x0, dtype=float)
+    r = b - A @ x
+    if np.linalg.norm(r, ord=np.inf) < prec:
+        return x, 0  # x0 уже решение (или b = 0) — иначе дальше alpha = 0 / 0
+    z = invDiag * r
+    p = z.copy()
+    rz = r @ z
+
+    for loop in range(1, maxSteps + 1):
+        Ap = A @ p
+        alpha = rz / (p @ Ap)
+        x += alpha * p
+        r -= alpha * Ap
+
+        if np.linalg.norm(r, ord=np.inf) < prec:
+            return x, loop
+
+        z = invDiag * r
+        rz_new = r @ z
+        p = z + (rz_new / rz) * p
+        rz = rz_new
+
+    print("за", maxSteps, "итераций CG не сошёлся...")
+    return x, maxSteps
+
+
+# Проверка на симметричность и положительную определённость.
+# Сначала дешёвое: симметрия и положительная диагональ. Дальше достаточный признак —
+# диагональное преобладание (тогда по Гершгорину все собственные числа > 0),
+# а для не слишком больших плотных матриц — просто пробуем разложение Холецкого.
+def isSPD(A, tol=1e-12, choleskyLimit=5000):
+    if A.shape[0] != A.shape[1]:
+        return False
+
+    scale = abs(A).max() or 1.0
+    diff = abs(A - A.T).max()
+    if diff > tol * scale or np.any(A.diagonal() <= 0):
+        return False
+
+    if notDominantRows(A).size == 0:
+        return True
+
+    if sp.issparse(A) or A.shape[0] > choleskyLimit:
+        return False
+
+    try:
+        np.linalg.cholesky(A)
+        return True
+    except np.linalg.LinAlgError:
+        return False
+
@@ -0,0 +1,199 @@
+import numpy as np
+import scipy.sparse as sp
+from scipy.linalg import solve_triangular
+from scipy.sparse.linalg import spsolve_triangular
+
+
+# Готовим матрицу к итерациям: A = (D + L) + U.
+# Нижний треугольник вместе с диагональю и строго верхний храним отдельно,
+# плотные — как numpy-массивы, разреженные — в CSR.
+def splitMatrix(A):
+    if sp.issparse(A):
+        A = sp.csr_matrix(A, dtype=float)
+        return sp.tril(A, format="csr"), sp.triu(A, k=1, format="csr")
+
+    A = np.asarray(A, dtype=float)
+    return np.tril(A), np.triu(A, k=1)
+
+
+# Решение системы с нижнетреугольной матрицей (прямая подстановка).
+# Правая часть может быть и вектором, и матрицей (n, k).
+def lowerSolve(lower, rhs):
+    if sp.issparse(lower):
+        return spsolve_triangular(lower, rhs, lower=True)
+    return solve_triangular(lower, rhs, lower=True, check_finite=False)
+
+
+# Один проход Гаусса-Зейделя.
+# В строке i слева от диагонали стоят уже новые x, справа ещё старые, то есть
+#     (D + L) x_new = b - U x_old
+# — это ровно те же итерации, что и в цикле по строкам, только прямая подстановка
+# делается целиком в scipy, а не поэлементно в питоне.
+def gaussSeidelSweep(lower, upper, b, x):
+    return lowerSolve(lower, b - upper @ x)
+
+
+# Тот же Гаусс-Зейдель, что и solveSomehow, только без вложенных циклов по j.
+# A — numpy-массив или разреженная матрица (CSR и т.п.), возвращает (x, число итераций).
+def gaussSeidel(A, b, prec, maxSteps=1000, x0=None):
+    lower, upper = splitMatrix(A)
+    b = np.asarray(b, dtype=float)
+    n = b.shape[0]
+
+    x = np.zeros(n, dtype=float) if x0 is None else np.array(x0, dtype=float)
+
+    for loop in range(1, maxSteps + 1):
+        old_x = x
+        x = gaussSeidelSweep(lower, upper, b, old_x)
+
+        change = np.linalg.norm(x - old_x, ord=np.inf)
+
+        if change < prec:
+            return x, loop
+
+    print("за", maxSteps, "итераций оно не сработало...")
+    return x, maxSteps
+
+
+# Пакетный режим: одна A и сразу много правых частей B размера (n, k).
+# Все столбцы итерируются вместе как одна матрица, у каждого столбца своя проверка
+# точности — сошедшиеся столбцы выкидываем из маски и больше не трогаем.
+# Возвращает (X, iterations), где iterations[j] — сколько итераций понадобилось столбцу j.
+def gaussSeidelBatch(A, B, prec, maxSteps=1000, X0=None):
+    lower, upper = splitMatrix(A)
+    B = np.asarray(B, dtype=float)
+    if B.ndim == 1:
+        B = B[:, None]
+    n, k = B.shape
+
+    X = np.zeros((n, k), dtype=float) if X0 is None else np.array(X0, dtype=float)
+    iterations = np.full(k, maxSteps, dtype=int)
+    active = np.arange(k)
+
+    for loop in range(1, maxSteps + 1):
+        old_X = X[:, active]
+        new_X = lowerSolve(lower, B[:, active] - upper @ old_X).reshape(n, -1)
+        X[:, active] = new_X
+
+        change = np.max(np.abs(new_X - old_X), axis=0)
+        done = change < prec
+        iterations[active[done]] = loop
+        active = active[~done]
+
+        if active.size == 0:
+            return X, iterations
+
+    print("за", maxSteps, "итераций не сошлись столбцы:", active)
+    return X, iterations
+
+
+# Насколько в среднем уменьшается change за итерацию на последних window шагах.
+# Для сходящегося процесса change_k ~ rho^k, поэтому среднее геометрическое
+# отношений соседних change — это оценка спектрального радиуса матрицы перехода.
+def contractionRate(changes, window=5):
+    if len(changes) < window + 1:
+        return None
+    recent = np.asarray(changes[-(window + 1):])
+    return float(np.exp(np.mean(np.log(recent[1:] / recent[:-1]))))
+
+
+# Оптимальный параметр релаксации по спектральному радиусу Гаусса-Зейделя
+# (для согласованно упорядоченных матриц rho_GS = rho_J^2):
+#     omega = 2 / (1 + sqrt(1 - rho_GS))
+def optimalOmega(rho):
+    rho = min(max(rho, 0.0), 0.999)
+    return 2 / (1 + np.sqrt(1 - rho))
+
+
+# Матрица D + omega * L для прохода верхней релаксации
+def relaxedLower(lower, d, omega):
+    if sp.issparse(lower):
+        return (omega * lower + (1 - omega) * sp.diags(d)).tocsr()
+    return omega * lower + (1 - omega) * np.diag(d)
+
+
+# Метод верхней релаксации (SOR):
+#     (D + omega L) x_new = omega b - (omega U + (omega - 1) D) x_old
+# При omega = 1 это ровно Гаусс-Зейдель.
+# Если omega не задан, первые probe итераций идут с omega = 1, по последним window из них
+# оцениваем спектральный радиус и дальше считаем уже с оптимальным omega (если стало хуже — откатываемся на 1).
+# Если change стал inf/nan, дальше считать бессмысленно — стоп сразу.
+# С earlyStop=True по той же оценке rho на последних window итерациях останавливаемся раньше maxSteps:
+#   rho > 1 + margin            — расходится,
+#   rho >= 1 - stall            — стоит на месте,
+#   нужно ещё больше, чем вдвое от оставшихся итераций — при такой скорости не успеет.
+# Чтобы не путать это с короткими всплесками (у SOR с оптимальным omega они бывают), оценка должна
+# быть плохой window итераций подряд.
+# Если не сошлось (в том числе при ранней остановке), возвращается (x, maxSteps), как у gaussSeidel.
+def solveSOR(A, b, prec, maxSteps=1000, omega=None, x0=None, probe=40, window=20, earlyStop=False,
+             margin=0.01, stall=1e-4):
+    lower, upper = splitMatrix(A)
+    d = lower.diagonal()
+    b = np.asarray(b, dtype=float)
+    n = b.shape[0]
+
+    tuning = omega is None
+    omega = 1.0 if tuning else omega
+    relaxed = relaxedLower(lower, d, omega)
+    rho_gs = None
+
+    x = np.zeros(n, dtype=float) if x0 is None else np.array(x0, dtype=float)
+    changes = []
+    bad = 0  # сколько итераций подряд оценка говорит, что не сойдётся
+
+    for loop in range(1, maxSteps + 1):
+        old_x = x
+        x = lowerSolve(relaxed, omega * (b - upper @ old_x) + (1 - omega) * d * old_x)
+
+        change = np.linalg.norm(x - old_x, ord=np.inf)
+
+        if change < prec:
+            return x, loop
+
+        if not np.isfinite(change):
+            print("метод расходится (получили inf/nan), стоп на итерации", loop)
+            return old_x, maxSteps
+
+        changes.append(change)
+
+        if tuning and len(changes) >= probe:
+            rho = contractionRate(changes, window)
+            if rho_gs is None and rho < 1:
+                # оценили Гаусса-Зейделя — переходим на оптимальный omega
+                rho_gs = rho
+                omega = optimalOmega(rho)
+                relaxed = relaxedLower(lower, d, omega)
+                changes = []
+            elif rho_gs is not None:
+                # omega подобрали, проверяем, что с ним сходится быстрее, чем у Гаусса-Зейделя
+                tuning = False
+                if rho > rho_gs:
+                    omega = 1.0
+                    relaxed = relaxedLower(lower, d, omega)
+                    changes = []
+            else:
+                tuning = False
+            continue
+
+        rho = contractionRate(changes, window) if earlyStop and not tuning else None
+        if rho is None:
+            continue
+
+        left = np.log(prec / change) / np.log(rho) if rho < 1 else np.inf
+        if rho > 1 + margin:
+            reason = "метод расходится"
+        elif rho >= 1 - stall:
+            reason = "метод стоит на месте"
+        elif left > 2 * (maxSteps - loop):
+            reason = f"нужно ещё ~{int(left)} итераций, а осталось {maxSteps - loop}"
+        else:
+            bad = 0
+            continue
+
+        bad += 1
+        if bad >= window:
+            print(reason, "(спектральный радиус ~", rho, "), стоп на итерации", loop)
+            return x, maxSteps
+
+    print("за", maxSteps, "итераций оно не сработало...")
+    return x, maxSteps
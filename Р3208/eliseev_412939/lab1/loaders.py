@@ -0,0 +1,125 @@
+import os
+from itertools import islice
+
+import numpy as np
+import scipy.sparse as sp
+
+# Загрузка больших систем. Формат выбирается по расширению файла:
+#   .npy  — расширенная матрица [A | b] размера (n, n+1), открывается через memmap
+#   .npz  — массивы A и b (np.savez) или CSR по кускам: data, indices, indptr, shape, b
+#   .mtx  — Matrix Market coordinate, читается построчно сразу в разреженную матрицу
+#   остальное — старый текстовый формат (n, потом n строк A, потом строка b), читается кусками
+
+
+# Расширенная матрица [A | b] -> A, b
+def _splitAugmented(M):
+    if M.shape[1] != M.shape[0] + 1:
+        raise ValueError(f"ожидалась расширенная матрица (n, n+1), а пришла {M.shape}")
+    if sp.issparse(M):
+        M = sp.csc_matrix(M)
+        return sp.csr_matrix(M[:, :-1]), M[:, -1].toarray().ravel()
+    return M[:, :-1], np.asarray(M[:, -1], dtype=float)
+
+
+def loadNpy(filename):
+    M = np.load(filename, mmap_mode="r")
+    return _splitAugmented(M)
+
+
+def loadNpz(filename):
+    with np.load(filename) as data:
+        if "indptr" in data:
+            A = sp.csr_matrix((data["data"], data["indices"], data["indptr"]), shape=tuple(data["shape"]))
+        else:
+            A = data["A"]
+        return A, np.asarray(data["b"], dtype=float)
+
+
+# Matrix Market: заголовок, комментарии с %, строка размеров, дальше записи "i j value".
+# Записи читаем кусками по chunk строк прямо в заранее выделенные массивы нужного размера (nnz из заголовка).
+def readMatrixMarket(filename, chunk=1 << 16):
+    with open(filename, "r", encoding="utf-8") as f:
+        header = f.readline().lower().split()
+        if len(header) < 5 or header[0] != "%%matrixmarket":
+            raise ValueError("это не Matrix Market файл")
+        layout, field, symmetry = header[2], header[3], header[4]
+        if field in ("complex", "pattern"):
+            raise ValueError(f"поле {field} не поддерживается")
+
+        line = f.readline()
+        while line.startswith("%") or not line.strip():
+            line = f.readline()
+        sizes = list(map(int, line.split()))
+
+        if layout == "array":
+            rows, cols = sizes
+            values = np.loadtxt(f, dtype=float, ndmin=1)
+            return values.reshape(cols, rows).T
+
+        rows, cols, nnz = sizes
+        I = np.empty(nnz, dtype=np.int64)
+        J = np.empty(nnz, dtype=np.int64)
+        V = np.empty(nnz, dtype=float)
+        pos = 0
+        while pos < nnz:
+            lines = list(islice(f, chunk))
+            if not lines:
+                break
+            block = np.array(" ".join(lines).split(), dtype=float).reshape(-1, 3)
+            end = pos + block.shape[0]
+            I[pos:end] = block[:, 0] - 1
+            J[pos:end] = block[:, 1] - 1
+            V[pos:end] = block[:, 2]
+            pos = end
+
+    if symmetry in ("symmetric", "skew-symmetric"):
+        off = I != J
+        sign = -1.0 if symmetry == "skew-symmetric" else 1.0
+        I, J, V = np.concatenate([I, J[off]]), np.concatenate([J, I[off]]), np.concatenate([V, sign * V[off]])
+
+    return sp.csr_matrix((V, (I, J)), shape=(rows, cols))
+
+
+# Сама система: либо расширенная матрица (n, n+1), либо A отдельно и b рядом в файле <имя>_b.mtx
+def loadMatrixMarket(filename):
+    A = readMatrixMarket(filename)
+    if A.shape[1] == A.shape[0] + 1:
+        return _splitAugmented(A)
+
+    stem, ext = os.path.splitext(filename)
+    rhs = readMatrixMarket(stem + "_b" + ext)
+    rhs = rhs.toarray() if sp.issparse(rhs) else rhs
+    return A, np.asarray(rhs, dtype=float).ravel()
+
+
+# Старый текстовый формат, но без readlines(): строки A читаются кусками
+# и разбираются numpy целым куском сразу в заранее выделенную матрицу.
+def loadText(filename, chunk=1024):
+    with open(filename, "r", encoding="utf-8") as f:
+        lines = (line for line in f if line.strip())
+        n = int(next(lines))
+        A = np.empty((n, n), dtype=float)
+
+        row = 0
+        while row < n:
+            block = list(islice(lines, min(chunk, n - row)))
+            if not block:
+                raise ValueError(f"в файле только {row} строк матрицы из {n}")
+            A[row:row + len(block)] = np.array(" ".join(block).split(), dtype=float).reshape(len(block), n)
+            row += len(block)
+
+        b = np.array(next(lines).split(), dtype=float)
+
+    return A, b
+
+
+loaders = {
+    ".npy": loadNpy,
+    ".npz": loadNpz,
+    ".mtx": loadMatrixMarket,
+}
+
+
+def loadSystem(filename):
+    ext = os.path.splitext(filename)[1].lower()
+    return loaders.get(ext, loadText)(filename)
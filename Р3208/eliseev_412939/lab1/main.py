@@ -1,4 +1,14 @@
+import time
+
 import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import spsolve
+
+from cache import matrixFingerprint
+from cg import conjugateGradient, isSPD
+from engine import gaussSeidel, gaussSeidelBatch, solveSOR
+from loaders import loadSystem
+from permutation import dominancePermutation, notDominantRows
 
 # короче, тут читаем матрицу
 def getMatManually():
@@ -16,23 +26,9 @@ def getMatManually():
 
 
 # мутка с файлом \
+# формат по расширению: .npy/.npz/.mtx или обычный текст (см. loaders.py)
 def getMatFromFile(filename):
-    with open(filename, "r", encoding="utf-8") as f:
-        lines = f.readlines()
-
-    lines = [line.strip() for line in lines if line.strip()]
-    n = int(lines[0])
-    A = []
-    idx = 1
-
-    for i in range(n):
-        row = list(map(float, lines[idx].split()))
-        A.append(row)
-        idx += 1
-
-    b = list(map(float, lines[idx].split()))
-
-    return np.array(A, dtype=float), np.array(b, dtype=float)
+    return loadSystem(filename)
 
 
 # генерация рандомной матрицы с диагональным преобладанием
@@ -48,73 +44,90 @@ def getMatRandom():
     return A, b
 
 
-# Пытается переставить строки так, чтобы
-#     обеспечить (или улучшить) диагональное преобладание.
-def fixDaMatrix(A, b):
-    n = A.shape[0]
-
-    rows = list(range(n))
-
-    for i in range(n):
-        max_row = i
-        max_val = abs(A[rows[i], i])
+# Перестановка строк: на i-е место встаёт строка rows[i]
+def findRows(A):
+    try:
+        return dominancePermutation(A)
+    except ValueError:
+        # полного паросочетания нет (структурно вырожденная матрица) — оставляем как есть
+        print("не получилось подобрать перестановку строк(((((")
+        return np.arange(A.shape[0])
 
-        for k in range(i + 1, n):
-            if abs(A[rows[k], i]) > max_val:
-                max_val = abs(A[rows[k], i])
-                max_row = k
 
-        if max_row != i:
-            rows[i], rows[max_row] = rows[max_row], rows[i]
+# Пытается переставить строки так, чтобы
+#     обеспечить (или улучшить) диагональное преобладание.
+# Перестановку ищем паросочетанием строк с местами на диагонали (см. permutation.py),
+# уже известную можно передать через rows.
+def fixDaMatrix(A, b, rows=None):
+    if rows is None:
+        rows = findRows(A)
 
     # Чтут передвигаем
     A_new = A[rows, :]
     b_new = b[rows]
 
     # Проверяем че по преобладанию
-    for i in range(n):
-        main_diag = abs(A_new[i, i])
-        other_vals = np.sum(np.abs(A_new[i])) - main_diag
-
-        if main_diag <= other_vals:
-            print("не получилось сделать преобладание в строке(((((", i)
-            return A_new, b_new
+    bad = notDominantRows(A_new)
+    if bad.size > 0:
+        print("не получилось сделать преобладание в строке(((((", bad[0])
 
     return A_new, b_new
 
 
 # Вычисляет одну из норм матрицы
 def badnessMeter(A):
-    return np.max(np.sum(np.abs(A), axis=1))
+    return np.max(abs(A).sum(axis=1))
 
 
 # Это типа метод Гаусса-Зейделя
+# (сами проходы теперь в engine.py, там же поддержка разреженных матриц).
+# Если не сошлось, число итераций = maxSteps.
 def solveSomehow(A, b, prec, maxSteps=1000):
-    n = A.shape[0]
-    x = np.zeros(n, dtype=float)
+    return gaussSeidel(A, b, prec, maxSteps)
 
-    for loop in range(1, maxSteps + 1):
-        old_x = x.copy()
 
-        for i in range(n):
-            sum_before = 0
-            for j in range(i):
-                sum_before += A[i, j] * x[j]
+# Гаусс-Зейдель с кэшем: если такую A уже решали, берём из кэша перестановку строк
+# (не переставляем заново) и прошлое решение как начальное приближение.
+# cache — объект SolutionCache из cache.py, счётчики попаданий в cache.hits / cache.misses.
+def solveCached(A, b, prec, cache, maxSteps=1000):
+    key = matrixFingerprint(A)
+    entry = cache.get(key)
+    if entry is None:
+        rows, x0 = findRows(A), None
+    else:
+        rows, x0 = entry
 
-            sum_after = 0
-            for j in range(i + 1, n):
-                sum_after += A[i, j] * old_x[j]
+    A, b = fixDaMatrix(A, b, rows)
+    x, loops = gaussSeidel(A, b, prec, maxSteps, x0=x0)
 
-            x[i] = (b[i] - sum_before - sum_after) / A[i, i]
+    cache.put(key, rows, x)
+    return x, loops
 
 
-        change = np.linalg.norm(x - old_x, ord=np.inf)
+# Сам выбирает метод: для симметричной положительно определённой A — CG с предобуславливателем
+# (проверяем до перестановки строк, перестановка симметрию ломает),
+# иначе как обычно: перестановка строк и Гаусс-Зейдель.
+# Возвращает (x, число итераций, название метода).
+def autoSolve(A, b, prec, maxSteps=1000):
+    if isSPD(A):
+        x, loops = conjugateGradient(A, b, prec, maxSteps)
+        return x, loops, "сопряжённых градиентов"
+
+    A, b = fixDaMatrix(A, b)
+    x, loops = solveSomehow(A, b, prec, maxSteps)
+    return x, loops, "Гаусса-Зейделя"
 
-        if change < prec:
-            return x, loop
 
-    print("за", maxSteps, "итераций оно не сработало...")
-    return x, maxSteps
+# Одна матрица A и куча правых частей B размера (n, k).
+# Перестановка строк и норма считаются один раз на все столбцы сразу,
+# возвращает (X, iterations) — решения по столбцам и итерации каждого столбца.
+def solveMany(A, B, prec, maxSteps=1000):
+    A, B = fixDaMatrix(A, B)
+
+    normA = badnessMeter(A)
+    print("норма матрицы =", normA)
+
+    return gaussSeidelBatch(A, B, prec, maxSteps)
 
 
 
@@ -134,7 +147,10 @@ def ghoestmain():
         A, b = getMatManually()
 
     n = A.shape[0]
+    spd = isSPD(A)
 
+    # для CG нужна исходная (симметричная) матрица, перестановка строк её портит
+    A_orig, b_orig = A, b
     A, b = fixDaMatrix(A, b)
 
     prec = 0.000001
@@ -142,15 +158,38 @@ def ghoestmain():
     normA = badnessMeter(A)
     print("норма матрицы =", normA)
 
+    start = time.perf_counter()
     x_res, loops = solveSomehow(A, b, prec, maxSteps=10000)
+    t_gs = time.perf_counter() - start
 
     print("\nВ итоге методом Гаусса-Зейделя получили:")
     print("Итераций понадобилось:", loops)
+    print(f"Время: {t_gs:.6f} с")
     print("Решение:", x_res)
 
+    start = time.perf_counter()
+    x_sor, loops_sor = solveSOR(A, b, prec, maxSteps=10000, earlyStop=True)
+    t_sor = time.perf_counter() - start
+    print("\nМетодом верхней релаксации (omega подбирается сам):")
+    print("Итераций понадобилось:", loops_sor)
+    print(f"Время: {t_sor:.6f} с")
+    print("Решение:", x_sor)
+
+    if spd:
+        start = time.perf_counter()
+        x_cg, loops_cg = conjugateGradient(A_orig, b_orig, prec, maxSteps=10000)
+        t_cg = time.perf_counter() - start
+        print("\nМатрица симметричная положительно определённая, так что ещё методом сопряжённых градиентов:")
+        print("Итераций понадобилось:", loops_cg)
+        print(f"Время: {t_cg:.6f} с")
+        print("Решение:", x_cg)
+
     try:
-        x_lib = np.linalg.solve(A, b)
+        start = time.perf_counter()
+        x_lib = spsolve(sp.csc_matrix(A), b) if sp.issparse(A) else np.linalg.solve(A, b)
+        t_lib = time.perf_counter() - start
         print("\nНу а numpy считает так:", x_lib)
+        print(f"Время: {t_lib:.6f} с")
         errVec = x_res - x_lib
         print("Разница:", errVec)
         leftover = A @ x_res - b
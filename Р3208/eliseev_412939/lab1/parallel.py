@@ -0,0 +1,171 @@
+import argparse
+import os
+import time
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import scipy.sparse as sp
+
+from engine import gaussSeidel, lowerSolve
+
+# Параллельный вариант: блочный Якоби поверх Гаусса-Зейделя.
+# Неизвестные режем на непрерывные блоки, внутри блока обычный проход Гаусса-Зейделя,
+# а значения из чужих блоков берём с прошлой итерации — поэтому блоки друг от друга
+# не зависят и считаются одновременно в разных процессах.
+# Матрица, b и оба вектора x лежат в общей памяти, процессам передаются только границы блоков.
+
+# это живёт в процессах-воркерах
+_shared = {}
+_handles = []
+_blockCache = {}
+
+
+def _openShared(name):
+    try:
+        return SharedMemory(name=name, track=False)
+    except TypeError:  # python < 3.13, там track нет
+        return SharedMemory(name=name)
+
+
+def _attach(specs, n):
+    _shared["n"] = n
+    for key, (name, shape, dtype) in specs.items():
+        shm = _openShared(name)
+        _handles.append(shm)
+        _shared[key] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+# строки lo..hi матрицы прямо из общей памяти, без копирования
+def _matrixRows(lo, hi):
+    if "A" in _shared:
+        return _shared["A"][lo:hi]
+
+    indptr = _shared["indptr"]
+    start, end = indptr[lo], indptr[hi]
+    return sp.csr_matrix(
+        (_shared["data"][start:end], _shared["indices"][start:end], indptr[lo:hi + 1] - start),
+        shape=(hi - lo, _shared["n"]),
+    )
+
+
+# Обновление одного блока:
+#     (D + L)_bb x_new_b = b_b - (A_b - (D + L)_bb) x_old
+def _updateBlock(bounds):
+    lo, hi = bounds
+    if bounds not in _blockCache:
+        rows = _matrixRows(lo, hi)
+        diagBlock = rows[:, lo:hi]
+        lower = sp.tril(diagBlock, format="csr") if sp.issparse(rows) else np.tril(diagBlock)
+        _blockCache[bounds] = (rows, lower)
+    rows, lower = _blockCache[bounds]
+
+    x = _shared["x_old"]
+    rhs = _shared["b"][lo:hi] - rows @ x + lower @ x[lo:hi]
+    _shared["x_new"][lo:hi] = lowerSolve(lower, rhs)
+
+
+# кладём массив в новый кусок общей памяти
+def _toShared(arr, segments):
+    arr = np.ascontiguousarray(arr)
+    shm = SharedMemory(create=True, size=max(arr.nbytes, 1))
+    segments.append(shm)
+    view = np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)
+    view[:] = arr
+    return view, (shm.name, arr.shape, arr.dtype.str)
+
+
+# Границы блоков: примерно поровну строк в каждом.
+def splitBlocks(n, blocks):
+    edges = np.linspace(0, n, min(blocks, n) + 1).astype(int)
+    return [(int(lo), int(hi)) for lo, hi in zip(edges[:-1], edges[1:])]
+
+
+# Блочный Гаусс-Зейдель на пуле процессов.
+# Контракт как у solveSomehow: возвращает (x, число итераций).
+# Итераций обычно чуть больше, чем у последовательного прохода (между блоками это Якоби),
+# зато каждая итерация делится на workers процессов.
+def parallelGaussSeidel(A, b, prec, maxSteps=1000, workers=None):
+    workers = workers or os.cpu_count()
+    b = np.asarray(b, dtype=float)
+    n = b.shape[0]
+
+    segments = []
+    try:
+        specs = {}
+        if sp.issparse(A):
+            A = sp.csr_matrix(A, dtype=float)
+            A.sort_indices()
+            for key in ("data", "indices", "indptr"):
+                _, specs[key] = _toShared(getattr(A, key), segments)
+        else:
+            _, specs["A"] = _toShared(np.asarray(A, dtype=float), segments)
+        _, specs["b"] = _toShared(b, segments)
+        x_old, specs["x_old"] = _toShared(np.zeros(n), segments)
+        x_new, specs["x_new"] = _toShared(np.zeros(n), segments)
+
+        blocks = splitBlocks(n, workers)
+
+        with Pool(workers, initializer=_attach, initargs=(specs, n)) as pool:
+            for loop in range(1, maxSteps + 1):
+                pool.map(_updateBlock, blocks, chunksize=1)
+
+                change = np.linalg.norm(x_new - x_old, ord=np.inf)
+                x_old[:] = x_new
+
+                if change < prec:
+                    return x_new.copy(), loop
+
+        print("за", maxSteps, "итераций оно не сработало...")
+        return x_new.copy(), maxSteps
+    finally:
+        for shm in segments:
+            shm.close()
+            shm.unlink()
+
+
+# Сравнение с обычным последовательным проходом из engine.py.
+# Печатает время, итерации и ускорение, возвращает ускорение.
+def benchParallel(A, b, prec, maxSteps=1000, workers=None):
+    workers = workers or os.cpu_count()
+
+    start = time.perf_counter()
+    x_ser, loops_ser = gaussSeidel(A, b, prec, maxSteps)
+    t_ser = time.perf_counter() - start
+
+    start = time.perf_counter()
+    x_par, loops_par = parallelGaussSeidel(A, b, prec, maxSteps, workers)
+    t_par = time.perf_counter() - start
+
+    speedup = t_ser / t_par
+    print(f"последовательно: {t_ser:.3f} с, итераций {loops_ser}")
+    print(f"параллельно ({workers} проц.): {t_par:.3f} с, итераций {loops_par}")
+    print(f"ускорение: {speedup:.2f}x")
+    print("разница решений:", np.linalg.norm(x_ser - x_par, ord=np.inf))
+    return speedup
+
+
+# Случайная разреженная матрица с диагональным преобладанием для замеров
+def randomSparseSystem(n, perRow=5, seed=None):
+    rng = np.random.default_rng(seed)
+    rows = np.repeat(np.arange(n), perRow)
+    cols = rng.integers(0, n, size=n * perRow)
+    vals = rng.random(n * perRow) * 10
+    A = sp.csr_matrix((vals, (rows, cols)), shape=(n, n))
+    off_diag_sum = np.asarray(abs(A).sum(axis=1)).ravel() - np.abs(A.diagonal())
+    A.setdiag(off_diag_sum + rng.uniform(1, 10, size=n))
+    b = rng.random(n) * 10
+    return A, b
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=200000, help="размерность системы")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="число процессов")
+    parser.add_argument("--dense", action="store_true", help="плотная матрица вместо разреженной")
+    args = parser.parse_args()
+
+    A, b = randomSparseSystem(args.n, seed=0)
+    if args.dense:
+        A = A.toarray()
+    benchParallel(A, b, 0.000001, maxSteps=10000, workers=args.workers)
@@ -0,0 +1,46 @@
+import numpy as np
+import scipy.sparse as sp
+from scipy.optimize import linear_sum_assignment
+from scipy.sparse.csgraph import min_weight_full_bipartite_matching
+
+
+# Запас преобладания для строки r, если поставить её на место c:
+#     |a_rc| / sum_j |a_rj|  —  больше 1/2 значит строгое преобладание.
+# Считаем относительный, чтобы строки с большими числами не перетягивали на себя всё.
+def dominanceWeights(A):
+    absA = abs(A)
+    rowsum = np.asarray(absA.sum(axis=1)).ravel()
+    rowsum[rowsum == 0] = 1.0
+    if sp.issparse(absA):
+        return sp.csr_matrix(sp.diags(1 / rowsum) @ absA)
+    return absA / rowsum[:, None]
+
+
+# Перестановка строк через максимальное паросочетание в двудольном графе
+# "строки -> места на диагонали" с весом = запас преобладания.
+# В отличие от жадного прохода по столбцам, ищет лучшую перестановку сразу для всех строк.
+# Возвращает rows: на i-е место встаёт строка rows[i] (как в A[rows, :]).
+def dominancePermutation(A):
+    weights = dominanceWeights(A)
+    n = weights.shape[0]
+
+    # ищем минимум стоимости, а стоимость должна быть положительной —
+    # переворачиваем: 2 - вес лежит в [1, 2]
+    if sp.issparse(weights):
+        cost = weights.copy()
+        cost.data = 2 - cost.data
+        rows_idx, cols = min_weight_full_bipartite_matching(cost)
+    else:
+        rows_idx, cols = linear_sum_assignment(2 - weights)
+
+    rows = np.empty(n, dtype=int)
+    rows[cols] = rows_idx
+    return rows
+
+
+# Номера строк, где нет строгого диагонального преобладания (всё массивами, без цикла по строкам)
+def notDominantRows(A):
+    absA = abs(A)
+    diag = np.abs(A.diagonal())
+    other = np.asarray(absA.sum(axis=1)).ravel() - diag
+    return np.flatnonzero(diag <= other)
@@ -0,0 +1,197 @@
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from dto.equation import Equation, system_from_descriptions
+from dto.polynomial_equation import PolynomialEquation
+from comparison import fresh_copy
+from main import equations, systems
+from methods.brent_method import BrentMethod
+from methods.multi_start import find_initial_approximations
+from methods.chord_method import ChordMethod
+from methods.newton_method import NewtonMethod
+from methods.secant_method import SecantMethod
+from methods.simple_iterations_method import SimpleIterationsMethod
+
+# Неинтерактивный запуск: python batch_runner.py jobs.csv -o results.jsonl -w 8
+#
+# Файл заданий (.csv, .json со списком объектов или .jsonl) — по строке на задание:
+#   equation — номер встроенного уравнения или его описание ('x^3 - 2x + 1')
+#   system   — номер встроенной системы или уравнения через ';' (вместо equation)
+#   a, b     — отрезок (для уравнения)
+#   eps      — точность
+#   method   — chord, secant, simple, brent (для уравнения) или newton, broyden (для системы)
+#   x0       — начальное приближение для системы (необязательно): список чисел
+#              ([1, 0.5, 0.2] в JSON, '1 0.5 0.2' или '1;0.5;0.2' в CSV); для двух переменных можно x0 и y0
+# Результаты пишутся в .csv или .jsonl по мере завершения заданий.
+
+METHODS_1D = {
+    'chord': ChordMethod,
+    'secant': SecantMethod,
+    'simple': SimpleIterationsMethod,
+    'brent': BrentMethod,
+}
+
+FIELDS = ['id', 'equation', 'system', 'method', 'a', 'b', 'eps', 'x', 'y', 'vector', 'iterations', 'evaluations',
+          'time', 'error']
+
+
+def read_jobs(path: str) -> list[dict]:
+    """
+    Читает задания из .csv, .json или .jsonl.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    with open(path, encoding='utf-8') as f:
+        if ext == '.csv':
+            jobs = list(csv.DictReader(f))
+        elif ext == '.jsonl':
+            jobs = [json.loads(line) for line in f if line.strip()]
+        else:
+            jobs = json.load(f)
+    for i, job in enumerate(jobs, 1):
+        job.setdefault('id', i)
+    return jobs
+
+
+def _present(value) -> bool:
+    return value is not None and str(value).strip() != ''
+
+
+def build_equation(spec) -> Equation:
+    """
+    Встроенное уравнение по номеру или новое по описанию (многочлен, если получается).
+    Встроенное копируется: иначе его кэш значений переживает задание, и число вычислений
+    у следующих заданий в том же процессе зависит от того, что считалось до них.
+    """
+    spec = str(spec).strip()
+    if spec.isdigit():
+        return fresh_copy(equations[int(spec)])
+    try:
+        return PolynomialEquation.from_description(spec)
+    except ValueError:
+        return Equation.from_description(spec)
+
+
+def build_system(spec) -> list[Equation]:
+    """
+    Встроенная система по номеру или новая из уравнений через ';'.
+    """
+    spec = str(spec).strip()
+    if spec.isdigit():
+        return [fresh_copy(eq) for eq in systems[int(spec)]]
+    return system_from_descriptions([part.strip() for part in spec.split(';') if part.strip()])
+
+
+def parse_start(job: dict):
+    """
+    Начальное приближение системы: список из x0 (или x0 и y0 по отдельности), None если не задано.
+    """
+    x0 = job.get('x0')
+    if not _present(x0):
+        return None
+    if isinstance(x0, (list, tuple)):
+        start = [float(v) for v in x0]
+    else:
+        start = [float(v) for v in str(x0).strip('[]').replace(',', ' ').replace(';', ' ').split()]
+    if _present(job.get('y0')):
+        start.append(float(job['y0']))
+    return start
+
+
+def start_for(system: list[Equation]):
+    """
+    Если x0 не задан: для двух уравнений NewtonMethod ищет его сам, для N уравнений берём
+    первое приближение из N-мерного поиска по сетке.
+    """
+    if len(system) == 2:
+        return None
+    starts = find_initial_approximations(system)
+    if not starts:
+        raise ValueError("Не удалось найти начальное приближение, задайте x0")
+    return starts[0]
+
+
+def run_job(job: dict) -> dict:
+    """
+    Выполняет одно задание (в процессе-воркере), ошибки не пробрасывает, а пишет в поле error.
+    """
+    row = {field: job.get(field) for field in FIELDS}
+    method = str(job.get('method', '')).strip().lower()
+    start = time.perf_counter()
+    try:
+        eps = float(job['eps'])
+        if _present(job.get('system')):
+            system = build_system(job['system'])
+            x0 = parse_start(job)
+            if x0 is None:
+                x0 = start_for(system)
+            elif len(x0) != len(system):
+                raise ValueError(f"в x0 {len(x0)} чисел, а уравнений {len(system)}")
+            res = NewtonMethod(system, eps, x0=x0, broyden=(method == 'broyden')).solve()
+        else:
+            if method not in METHODS_1D:
+                raise ValueError(f"Неизвестный метод '{method}', доступны: {', '.join(METHODS_1D)}")
+            equation = build_equation(job['equation'])
+            res = METHODS_1D[method](equation, float(job['a']), float(job['b']), eps, 6).solve()
+        row.update(x=res.x, y=res.y, iterations=res.iterations, evaluations=res.evaluations,
+                   vector=None if res.vector is None else [float(v) for v in res.vector])
+    except Exception as e:
+        row['error'] = f'{type(e).__name__}: {e}'
+    row['time'] = time.perf_counter() - start
+    return row
+
+
+class ResultWriter:
+    """
+    Пишет результаты в CSV или JSON Lines построчно, сразу сбрасывая на диск.
+    """
+
+    def __init__(self, path: str = None):
+        self.file = open(path, 'w', encoding='utf-8', newline='') if path else sys.stdout
+        self.jsonl = path is None or os.path.splitext(path)[1].lower() != '.csv'
+        if not self.jsonl:
+            self.writer = csv.DictWriter(self.file, fieldnames=FIELDS)
+            self.writer.writeheader()
+
+    def write(self, row: dict):
+        if self.jsonl:
+            self.file.write(json.dumps(row, ensure_ascii=False, default=float) + '\n')
+        else:
+            self.writer.writerow(row)
+        self.file.flush()
+
+    def close(self):
+        if self.file is not sys.stdout:
+            self.file.close()
+
+
+def run_jobs(jobs: list[dict], output: str = None, workers: int = None) -> list[dict]:
+    """
+    Раздаёт задания пулу процессов, результаты пишет по мере готовности.
+    """
+    writer = ResultWriter(output)
+    rows = []
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(run_job, job) for job in jobs]
+            for future in as_completed(futures):
+                row = future.result()
+                writer.write(row)
+                rows.append(row)
+    finally:
+        writer.close()
+    return rows
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Пакетное решение уравнений и систем без диалога')
+    parser.add_argument('jobs', help='файл заданий: .csv, .json или .jsonl')
+    parser.add_argument('-o', '--output', help='куда писать результаты: .csv или .jsonl (по умолчанию stdout)')
+    parser.add_argument('-w', '--workers', type=int, default=None, help='число процессов')
+    args = parser.parse_args()
+
+    run_jobs(read_jobs(args.jobs), args.output, args.workers)
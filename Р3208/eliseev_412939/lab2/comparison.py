@@ -0,0 +1,44 @@
+from dto.equation import Equation
+from dto.polynomial_equation import PolynomialEquation
+from main import equations
+from methods.brent_method import BrentMethod
+from methods.chord_method import ChordMethod
+from methods.root_isolation import isolate_roots
+from methods.secant_method import SecantMethod
+from methods.simple_iterations_method import SimpleIterationsMethod
+
+compared_methods = [ChordMethod, SecantMethod, SimpleIterationsMethod, BrentMethod]
+
+
+def fresh_copy(equation: Equation) -> Equation:
+    """
+    Копия уравнения с пустым кэшем, чтобы методы не пользовались чужими вычислениями.
+    """
+    if isinstance(equation, PolynomialEquation):
+        return PolynomialEquation(equation.coefficients, equation.description)
+    return Equation(equation.function, equation.description, derivative=equation.derivative)
+
+
+def compare(lo: float = -10, hi: float = 10, cells: int = 20, eps: float = 1e-6, decimal_places: int = 6):
+    """
+    Сравнение методов на встроенных уравнениях: [lo, hi] делится на cells отрезков,
+    для каждого отрезка со сменой знака запускаем все методы и печатаем корень, число итераций
+    и число вычислений функции (вместе с вычислениями производной — у простой итерации и секущих они есть).
+    """
+    print(f"{'уравнение':<45} {'отрезок':<16} {'метод':<24} {'корень':>14} {'итераций':>9} {'вычислений':>11}")
+    for equation in equations.values():
+        left, right, _ = isolate_roots(equation, lo, hi, points=cells, refine=0)
+        for a, b in zip(left, right):
+            for method in compared_methods:
+                interval = f"[{a:g}, {b:g}]"
+                try:
+                    res = method(fresh_copy(equation), a, b, eps, decimal_places).solve()
+                    line = f"{res.x:>14.8f} {res.iterations:>9} {res.evaluations:>11}"
+                except Exception as e:
+                    line = f"{'—':>14}  {e}"
+                print(f"{equation.description:<45} {interval:<16} {method.name:<24} {line}")
+        print()
+
+
+if __name__ == '__main__':
+    compare()
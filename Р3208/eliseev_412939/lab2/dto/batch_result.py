@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass
+class BatchResult:
+    """
+    Класс-результат пакетного решения: по одному значению на каждое уравнение (полосу).
+    """
+    roots: np.ndarray
+    iterations: np.ndarray
+    converged: np.ndarray
+
+    def __str__(self):
+        return (f"Решено уравнений: {int(self.converged.sum())} из {len(self.roots)}\n"
+                f"Итераций: от {self.iterations.min()} до {self.iterations.max()}")
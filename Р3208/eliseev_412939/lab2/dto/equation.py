@@ -1,5 +1,12 @@
-from typing import Callable
-from scipy.differentiate import derivative
+from collections import OrderedDict
+from typing import Callable, Optional, Sequence
+
+import numpy as np
+from scipy import differentiate
+
+from dto.expression import Expression
+
+CACHE_SIZE = 256
 
 
 class Equation:
@@ -7,10 +14,66 @@ class Equation:
     Класс представляющий мат. функцию и её описание
     """
 
-    def __init__(self, function: Callable, description: str):
+    def __init__(self, function: Callable, description: str, cache_size: int = CACHE_SIZE,
+                 derivative: Optional[Callable] = None):
         self.function = function
         self.description = description
+        self.derivative = derivative
+        self.cache_size = cache_size
+        self.evaluations = 0
+        self._cache = OrderedDict()
+
+    def __call__(self, *args):
+        """
+        Значение функции с запоминанием: уже посчитанные точки берутся из кэша
+        (последние cache_size штук), а каждое настоящее вычисление увеличивает счётчик evaluations.
+        Массивы не кэшируются, считаются поточечно.
+        """
+        if any(isinstance(arg, np.ndarray) for arg in args):
+            self.evaluations += max(np.size(arg) for arg in args)
+            return self.function(*args)
+
+        cache = self._cache
+        if args in cache:
+            cache.move_to_end(args)
+            return cache[args]
+
+        self.evaluations += 1
+        value = self.function(*args)
+        cache[args] = value
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
+        return value
+
+    @classmethod
+    def from_description(cls, description: str, variables: Optional[Sequence[str]] = None) -> 'Equation':
+        """
+        Уравнение прямо из текстового описания: описание разбирается и компилируется один раз,
+        заодно считается точная производная (для функции одной переменной).
+        :param description: например 'x^3 - 1.89 * x^2 - 2 * x + 1.76' или 'x^2 + y^2 = 4'
+        :param variables: порядок переменных, по умолчанию по алфавиту
+        """
+        expression = Expression(description, variables)
+        df = expression.derivative().function if len(expression.variables) == 1 else None
+        return cls(expression.function, description, derivative=df)
+
+    def df(self, x):
+        """
+        Производная в точке: точная, если она известна, иначе численная (scipy).
+        Вычисление точной производной тоже идёт в evaluations (по одному на точку),
+        численная и так считается через вызовы самой функции.
+        """
+        if self.derivative is not None:
+            self.evaluations += np.size(x)
+            return self.derivative(x)
+        return differentiate.derivative(self, x).df
 
+    def clear_cache(self):
+        """
+        Очищает кэш значений и обнуляет счётчик вычислений.
+        """
+        self._cache.clear()
+        self.evaluations = 0
 
     def root_exists(self, a: float, b: float):
         """
@@ -19,12 +82,40 @@ class Equation:
         :param b: Правая граница отрезка.
         :return: True, если функция имеет решения на выбранном отрезке.
         """
-        f = self.function
+        f = self
 
         fa = f(a)
         fb = f(b)
 
-        fa_ = derivative(f, a).df
-        fb_ = derivative(f, b).df
+        fa_ = f.df(a)
+        fb_ = f.df(b)
+
+        return (fa * fb < 0) and (fa_ * fb_ > 0)
+
 
-        return (fa * fb < 0) and (fa_ * fb_ > 0)
\ No newline at end of file
+def load_equations(path: str) -> list:
+    """
+    Загружает уравнения из текстового файла, по одному описанию на строку (пустые строки и # пропускаются).
+    Строка с несколькими уравнениями через ';' — это система от переменных x, y, ...
+    :return: список из Equation (для уравнений) и list[Equation] (для систем)
+    """
+    loaded = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.split('#', 1)[0].strip()
+            if not line:
+                continue
+            parts = [part.strip() for part in line.split(';') if part.strip()]
+            if len(parts) == 1:
+                loaded.append(Equation.from_description(parts[0]))
+            else:
+                loaded.append(system_from_descriptions(parts))
+    return loaded
+
+
+def system_from_descriptions(descriptions: Sequence[str]) -> list:
+    """
+    Система из текстовых описаний: у всех уравнений общий список переменных (по алфавиту).
+    """
+    variables = sorted({v for description in descriptions for v in Expression(description).variables})
+    return [Equation.from_description(description, variables) for description in descriptions]
@@ -0,0 +1,240 @@
+import ast
+import re
+from typing import Callable, Optional, Sequence
+
+import numpy as np
+
+# Функции, которые можно писать в описании уравнения, и их аналоги из NumPy
+FUNCTIONS = {
+    'sin': np.sin, 'cos': np.cos, 'tan': np.tan, 'tg': np.tan,
+    'arcsin': np.arcsin, 'arccos': np.arccos, 'arctan': np.arctan, 'arctg': np.arctan,
+    'sinh': np.sinh, 'cosh': np.cosh, 'tanh': np.tanh,
+    'exp': np.exp, 'log': np.log, 'ln': np.log, 'sqrt': np.sqrt, 'abs': np.abs, 'sign': np.sign,
+}
+CONSTANTS = {'pi': np.pi, 'e': np.e}
+
+
+def _number(value: float) -> ast.expr:
+    if value < 0:
+        return ast.UnaryOp(ast.USub(), ast.Constant(-value))
+    return ast.Constant(value)
+
+
+def _value(node: ast.expr) -> Optional[float]:
+    """
+    Числовое значение узла, если это константа (в том числе отрицательная), иначе None.
+    """
+    if isinstance(node, ast.Constant):
+        return node.value
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub) and isinstance(node.operand, ast.Constant):
+        return -node.operand.value
+    return None
+
+
+# Конструкторы узлов с простейшими упрощениями (0 + u, 1 * u, u ^ 1 и т.п.),
+# иначе производные быстро разрастаются
+def _add(u, v):
+    if _value(u) == 0:
+        return v
+    if _value(v) == 0:
+        return u
+    if _value(u) is not None and _value(v) is not None:
+        return _number(_value(u) + _value(v))
+    return ast.BinOp(u, ast.Add(), v)
+
+
+def _sub(u, v):
+    if _value(v) == 0:
+        return u
+    if _value(u) == 0:
+        return _neg(v)
+    if _value(u) is not None and _value(v) is not None:
+        return _number(_value(u) - _value(v))
+    return ast.BinOp(u, ast.Sub(), v)
+
+
+def _neg(u):
+    if _value(u) is not None:
+        return _number(-_value(u))
+    if isinstance(u, ast.UnaryOp) and isinstance(u.op, ast.USub):
+        return u.operand
+    return ast.UnaryOp(ast.USub(), u)
+
+
+def _mul(u, v):
+    if _value(u) == 0 or _value(v) == 0:
+        return ast.Constant(0)
+    if _value(u) == 1:
+        return v
+    if _value(v) == 1:
+        return u
+    if _value(u) is not None and _value(v) is not None:
+        return _number(_value(u) * _value(v))
+    return ast.BinOp(u, ast.Mult(), v)
+
+
+def _div(u, v):
+    if _value(u) == 0:
+        return ast.Constant(0)
+    if _value(v) == 1:
+        return u
+    return ast.BinOp(u, ast.Div(), v)
+
+
+def _pow(u, v):
+    if _value(v) == 0:
+        return ast.Constant(1)
+    if _value(v) == 1:
+        return u
+    return ast.BinOp(u, ast.Pow(), v)
+
+
+def _call(name, arg):
+    return ast.Call(ast.Name(name, ast.Load()), [arg], [])
+
+
+class Expression:
+    """
+    Класс для разбора текстового описания функции (того же, что пишется в description)
+    в дерево выражения, компиляции его в векторизованную NumPy-функцию и
+    точного (символьного) дифференцирования.
+    """
+
+    def __init__(self, text: str, variables: Optional[Sequence[str]] = None, tree: Optional[ast.expr] = None):
+        """
+        :param text: описание вида 'x^3 - 2x + 1', 'tg(x * y + 0.3) - x^2 = 0' или 'y = 3x^2'
+        :param variables: порядок переменных в скомпилированной функции, по умолчанию — по алфавиту
+        :param tree: готовое дерево (используется при дифференцировании)
+        """
+        self.text = text
+        self.tree = tree if tree is not None else self._parse(text)
+        self._check(self.tree)
+        names = sorted({node.id for node in ast.walk(self.tree) if isinstance(node, ast.Name)}
+                       - FUNCTIONS.keys() - CONSTANTS.keys())
+        self.variables = tuple(variables) if variables is not None else tuple(names)
+        unknown = set(names) - set(self.variables)
+        if unknown:
+            raise ValueError(f"Неизвестные переменные в выражении '{text}': {', '.join(sorted(unknown))}")
+        self.function = self._compile()
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        """
+        Приводит запись к синтаксису Python: ^ -> **, неявное умножение (3x, 2(x + 1), )( ) -> явное.
+        """
+        text = text.replace('^', '**')
+        text = re.sub(r'(?<![\w.])(\d+\.?\d*(?:[eE][+-]?\d+)?)\s*(?=[a-zA-Z_(])', r'\1*', text)
+        text = re.sub(r'\)\s*(?=[\w(])', ')*', text)
+        return text
+
+    def _parse(self, text: str) -> ast.expr:
+        """
+        Разбирает описание в дерево; уравнение вида 'левая = правая' превращается в 'левая - (правая)'.
+        """
+        parts = text.split('=')
+        if len(parts) > 2:
+            raise ValueError(f"В выражении '{text}' больше одного знака '='")
+        trees = [ast.parse(self._normalize(part.strip()), mode='eval').body for part in parts]
+        if len(trees) == 2:
+            return _sub(trees[0], trees[1])
+        return trees[0]
+
+    @staticmethod
+    def _check(tree: ast.expr):
+        """
+        Разрешаем только арифметику, числа, переменные и функции из FUNCTIONS.
+        """
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Call):
+                if not isinstance(node.func, ast.Name) or node.func.id not in FUNCTIONS or len(node.args) != 1 \
+                        or node.keywords:
+                    raise ValueError(f"Неподдерживаемый вызов функции: {ast.unparse(node)}")
+            elif not isinstance(node, (ast.BinOp, ast.UnaryOp, ast.Name, ast.Constant, ast.Load,
+                                       ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.USub, ast.UAdd)):
+                raise ValueError(f"Неподдерживаемая конструкция: {ast.unparse(node)}")
+            elif isinstance(node, ast.Constant) and not isinstance(node.value, (int, float)):
+                raise ValueError(f"Неподдерживаемая константа: {node.value!r}")
+
+    def _compile(self) -> Callable:
+        """
+        Компилирует дерево один раз в обычную функцию от переменных; работает и с числами, и с массивами.
+        """
+        args = ast.arguments(posonlyargs=[], args=[ast.arg(v) for v in self.variables], kwonlyargs=[],
+                             kw_defaults=[], defaults=[])
+        tree = ast.fix_missing_locations(ast.Expression(ast.Lambda(args, self.tree)))
+        namespace = {**FUNCTIONS, **CONSTANTS}
+        function = eval(compile(tree, f'<{self.text}>', 'eval'), namespace)
+
+        if any(isinstance(node, ast.Name) and node.id in self.variables for node in ast.walk(self.tree)):
+            return function
+        # выражение без переменных (например, производная линейной функции) растягиваем до формы аргументов
+        return lambda *xs: function(*xs) + np.zeros(np.broadcast(*xs).shape)
+
+    def derivative(self, variable: Optional[str] = None) -> 'Expression':
+        """
+        Точная производная по переменной (по умолчанию — по первой).
+        :return: новое выражение, тоже скомпилированное
+        """
+        variable = variable or self.variables[0]
+        tree = self._differentiate(self.tree, variable)
+        return Expression(ast.unparse(tree), self.variables, tree)
+
+    def _differentiate(self, node: ast.expr, var: str) -> ast.expr:
+        d = lambda u: self._differentiate(u, var)
+
+        if isinstance(node, ast.Constant):
+            return ast.Constant(0)
+        if isinstance(node, ast.Name):
+            return ast.Constant(1 if node.id == var else 0)
+        if isinstance(node, ast.UnaryOp):
+            return _neg(d(node.operand)) if isinstance(node.op, ast.USub) else d(node.operand)
+
+        if isinstance(node, ast.BinOp):
+            u, v = node.left, node.right
+            if isinstance(node.op, ast.Add):
+                return _add(d(u), d(v))
+            if isinstance(node.op, ast.Sub):
+                return _sub(d(u), d(v))
+            if isinstance(node.op, ast.Mult):
+                return _add(_mul(d(u), v), _mul(u, d(v)))
+            if isinstance(node.op, ast.Div):
+                return _div(_sub(_mul(d(u), v), _mul(u, d(v))), _pow(v, ast.Constant(2)))
+            if isinstance(node.op, ast.Pow):
+                n = _value(v)
+                if n is not None:
+                    # (u^n)' = n * u^(n-1) * u'
+                    return _mul(_mul(_number(n), _pow(u, _number(n - 1))), d(u))
+                # (u^v)' = u^v * (v' * ln(u) + v * u' / u)
+                return _mul(node, _add(_mul(d(v), _call('log', u)), _div(_mul(v, d(u)), u)))
+
+        if isinstance(node, ast.Call):
+            name, u = node.func.id, node.args[0]
+            outer = {
+                'sin': lambda: _call('cos', u),
+                'cos': lambda: _neg(_call('sin', u)),
+                'tan': lambda: _div(ast.Constant(1), _pow(_call('cos', u), ast.Constant(2))),
+                'tg': lambda: _div(ast.Constant(1), _pow(_call('cos', u), ast.Constant(2))),
+                'arcsin': lambda: _div(ast.Constant(1), _call('sqrt', _sub(ast.Constant(1), _pow(u, ast.Constant(2))))),
+                'arccos': lambda: _neg(_div(ast.Constant(1),
+                                            _call('sqrt', _sub(ast.Constant(1), _pow(u, ast.Constant(2)))))),
+                'arctan': lambda: _div(ast.Constant(1), _add(ast.Constant(1), _pow(u, ast.Constant(2)))),
+                'arctg': lambda: _div(ast.Constant(1), _add(ast.Constant(1), _pow(u, ast.Constant(2)))),
+                'sinh': lambda: _call('cosh', u),
+                'cosh': lambda: _call('sinh', u),
+                'tanh': lambda: _div(ast.Constant(1), _pow(_call('cosh', u), ast.Constant(2))),
+                'exp': lambda: node,
+                'log': lambda: _div(ast.Constant(1), u),
+                'ln': lambda: _div(ast.Constant(1), u),
+                'sqrt': lambda: _div(ast.Constant(1), _mul(ast.Constant(2), node)),
+                'abs': lambda: _call('sign', u),
+                'sign': lambda: ast.Constant(0),
+            }[name]()
+            return _mul(outer, d(u))
+
+        raise ValueError(f"Не умею дифференцировать: {ast.unparse(node)}")
+
+    def __call__(self, *args):
+        return self.function(*args)
+
+    def __str__(self):
+        return self.text
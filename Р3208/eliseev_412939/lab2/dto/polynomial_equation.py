@@ -0,0 +1,180 @@
+import ast
+
+import numpy as np
+
+from dto.equation import Equation
+from dto.expression import Expression
+
+MAX_DEGREE = 20
+# Точки на отрезке между двумя собственными числами, где проверяем, что f там не отличить от нуля.
+# Не середина и не четверти, чтобы не попасть ровно в другой корень (у x^3 - x середина между -1 и 1 — корень)
+CHORD_POINTS = np.array([0.5 - np.sqrt(3) / 6, 0.5 + np.sqrt(3) / 6])
+
+
+def _is_polynomial(tree: ast.expr) -> bool:
+    """
+    Проверка по дереву: только +, -, *, деление на число и целые неотрицательные степени.
+    """
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call):
+            return False
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Div):
+            if any(isinstance(child, ast.Name) for child in ast.walk(node.right)):
+                return False
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Pow):
+            exponent = node.right.value if isinstance(node.right, ast.Constant) else None
+            if not isinstance(exponent, (int, float)) or exponent < 0 or exponent != int(exponent):
+                return False
+    return True
+
+
+class PolynomialEquation(Equation):
+    """
+    Класс для уравнения-многочлена: хранятся коэффициенты (от старшей степени к младшей),
+    f и f' считаются вместе по схеме Горнера, а все корни сразу — как собственные числа
+    сопровождающей матрицы.
+    """
+
+    def __init__(self, coefficients, description: str = None):
+        coefficients = np.trim_zeros(np.asarray(coefficients, dtype=float), 'f')
+        if coefficients.size == 0:
+            coefficients = np.zeros(1)
+        self.coefficients = coefficients
+        self._last = None  # (x, f(x), f'(x)) последней скалярной точки — f и f' в ней уже посчитаны вместе
+        if description is None:
+            description = ' + '.join(f'{c} * x^{len(coefficients) - 1 - i}' for i, c in enumerate(coefficients))
+        super().__init__(self.value, description, derivative=self.slope)
+
+    @classmethod
+    def from_description(cls, description: str, variables=None) -> 'PolynomialEquation':
+        """
+        Многочлен из текстового описания. Коэффициенты находятся по формуле Тейлора в нуле:
+        c_k = f^(k)(0) / k!, производные — точные, из Expression; дифференцируем, пока не получится константа.
+        """
+        expression = Expression(description, variables or ('x',))
+        if not _is_polynomial(expression.tree):
+            raise ValueError(f"'{description}' не многочлен")
+
+        taylor = []
+        factorial = 1.0
+        for k in range(MAX_DEGREE + 2):
+            if k > 0:
+                factorial *= k
+            taylor.append(float(expression(0.0)) / factorial)
+            if not any(isinstance(node, ast.Name) and node.id in expression.variables
+                       for node in ast.walk(expression.tree)):
+                return cls(taylor[::-1], description)
+            expression = expression.derivative()
+        raise ValueError(f"'{description}' не многочлен (или степень больше {MAX_DEGREE})")
+
+    def horner(self, x):
+        """
+        f(x) и f'(x) за один проход по схеме Горнера (работает и с массивами x, в том числе комплексными).
+        :return: (f(x), f'(x))
+        """
+        p = np.zeros_like(x, dtype=np.result_type(x, float)) + self.coefficients[0]
+        dp = np.zeros_like(p)
+        for c in self.coefficients[1:]:
+            dp = dp * x + p
+            p = p * x + c
+        return p, dp
+
+    def _horner_scalar(self, x):
+        """
+        Горнер с запоминанием последней точки: value(x) и slope(x) в одной точке
+        (как в root_exists или шаге Ньютона) стоят один проход, а не два.
+        """
+        if isinstance(x, np.ndarray) and x.ndim > 0:
+            return self.horner(x)
+        if self._last is None or self._last[0] != x:
+            self._last = (x, *self.horner(x))
+        return self._last[1:]
+
+    def value(self, x):
+        return self._horner_scalar(x)[0]
+
+    def slope(self, x):
+        return self._horner_scalar(x)[1]
+
+    def df(self, x):
+        """
+        f'(x): в evaluations идёт только настоящий проход Горнера — если f в этой точке
+        только что считали, f' уже есть и ничего не стоит.
+        """
+        if isinstance(x, np.ndarray) and x.ndim > 0:
+            self.evaluations += x.size
+        elif self._last is None or self._last[0] != x:
+            self.evaluations += 1
+        return self.slope(x)
+
+    def root_exists(self, a: float, b: float):
+        """
+        То же, что у Equation, но f и f' на обоих концах — один проход Горнера по массиву [a, b].
+        """
+        (fa, fb), (fa_, fb_) = self.horner(np.array([a, b], dtype=float))
+        self.evaluations += 2
+        return bool((fa * fb < 0) and (fa_ * fb_ > 0))
+
+    @property
+    def degree(self) -> int:
+        return self.coefficients.size - 1
+
+    def all_roots(self) -> np.ndarray:
+        """
+        Все (в том числе комплексные) корни — собственные числа сопровождающей матрицы.
+        """
+        if self.degree < 1:
+            return np.array([])
+        c = self.coefficients / self.coefficients[0]
+        companion = np.zeros((self.degree, self.degree))
+        companion[0, :] = -c[1:]
+        companion[1:, :-1] = np.eye(self.degree - 1)
+        return np.linalg.eigvals(companion)
+
+    def noise(self, x):
+        """
+        Оценка ошибки округления Горнера в x: 2 * степень * eps_машинное * sum |c_i| |x|^i.
+        Если |f(x)| не больше этого, x от корня в арифметике double уже не отличить.
+        """
+        return 2 * self.degree * np.finfo(float).eps * np.polyval(np.abs(self.coefficients), np.abs(x))
+
+    def real_roots(self, lo: float = -np.inf, hi: float = np.inf, eps: float = 1e-12,
+                   max_steps: int = 50) -> np.ndarray:
+        """
+        Различные вещественные корни на [lo, hi] с точностью eps.
+        Собственные числа у кратного корня расползаются облачком (для (x-1)^3 — на ~1e-5, часть из них
+        комплексные), поэтому сначала склеиваем близкие собственные числа: два числа в одной группе, если
+        они ближе eps или f на отрезке между ними (в точках CHORD_POINTS) не отличить от нуля (см. noise). Среднее по группе
+        из m чисел — хорошее начальное приближение корня кратности m, его уточняем Ньютоном с шагом m * f / f',
+        пока шаг не станет меньше eps (или f не упадёт до уровня ошибок округления, или не кончатся max_steps).
+        """
+        z = self.all_roots()
+        group = np.arange(z.size)
+        for i in range(z.size):
+            for j in range(i + 1, z.size):
+                points = z[i] + (z[j] - z[i]) * CHORD_POINTS
+                if abs(z[i] - z[j]) <= eps or np.all(np.abs(self.horner(points)[0]) <= self.noise(points)):
+                    group[group == group[j]] = group[i]
+
+        roots = []
+        for g in np.unique(group):
+            members = z[group == g]
+            x = members.mean()
+            if abs(x.imag) > 1e-8 * (1 + abs(x.real)):
+                continue
+            x, m = x.real, members.size
+            for _ in range(max_steps):
+                p, dp = self.horner(x)
+                if abs(p) <= self.noise(x) or dp == 0:
+                    break
+                step = m * p / dp
+                x -= step
+                if abs(step) < eps:
+                    break
+            roots.append(x)
+
+        roots = np.sort(roots)
+        if roots.size > 1:
+            # после уточнения разные группы могли сойтись в один корень
+            roots = roots[np.concatenate([[True], np.diff(roots) > eps])]
+        return roots[(roots >= lo) & (roots <= hi)]
@@ -9,11 +9,18 @@ class Result:
     """
     x: float
     iterations: int
-    y: Optional[float]
+    y: Optional[float] = None
+    evaluations: Optional[int] = None
+    vector: Optional[List[float]] = None
 
     def __str__(self):
-        parts = [f"Корень: x = {self.x}"]
-        if self.y is not None:
-            parts.append(f"y = {self.y}")
+        if self.vector is not None and len(self.vector) > 2:
+            parts = [f"Решение: {self.vector}"]
+        else:
+            parts = [f"Корень: x = {self.x}"]
+            if self.y is not None:
+                parts.append(f"y = {self.y}")
         parts.append(f"Число итераций: {self.iterations}")
+        if self.evaluations is not None:
+            parts.append(f"Вычислений функции: {self.evaluations}")
         return "\n".join(parts)
@@ -1,8 +1,12 @@
 import matplotlib.pyplot as plt
 import numpy as np
-from dto.equation import Equation
+from dto.equation import Equation, load_equations
+from dto.polynomial_equation import PolynomialEquation
+from methods.brent_method import BrentMethod
 from methods.chord_method import ChordMethod
+from methods.multi_start import solve_all
 from methods.newton_method import NewtonMethod
+from methods.root_isolation import find_all_roots
 from methods.secant_method import SecantMethod
 from methods.simple_iterations_method import SimpleIterationsMethod
 
@@ -12,28 +16,40 @@ methods = {
     2: SecantMethod,
     3: SimpleIterationsMethod,
     4: NewtonMethod,
+    5: BrentMethod,
 }
 
 # Одномерные нелинейные уравнения
 equations = {
-    1: Equation(lambda x: (x**3 - 1.89*x**2 - 2*x + 1.76), 'x^3 - 1.89 * x^2 - 2 * x + 1.76'),
-    2: Equation(lambda x: (-1.38*x**3 - 5.42*x**2 + 2.57*x + 10.95), '-1.38 * x^3 - 5.42 * x^2 + 2.57 * x + 10.95'),
-    3: Equation(lambda x: (-1.8*x**3 - 2.94*x**2 + 10.37*x + 5.38), '-1.8 * x^3 - 2.94 * x^2 + 10.37 * x + 5.38'),
-    4: Equation(lambda x: (x**3 + 2.84*x**2 - 5.606 * x - 14.766), 'x^3 + 2.84 * x^2 - 5.606 * x - 14.766'),
+    1: PolynomialEquation.from_description('x^3 - 1.89 * x^2 - 2 * x + 1.76'),
+    2: PolynomialEquation.from_description('-1.38 * x^3 - 5.42 * x^2 + 2.57 * x + 10.95'),
+    3: PolynomialEquation.from_description('-1.8 * x^3 - 2.94 * x^2 + 10.37 * x + 5.38'),
+    4: PolynomialEquation.from_description('x^3 + 2.84 * x^2 - 5.606 * x - 14.766'),
 }
 
 # Системы уравнений
 systems = {
     1: [
-        Equation(lambda x, y: x ** 2 + y ** 2 - 4, 'x^2 + y^2 = 4'),
-        Equation(lambda x, y: -3 * x ** 2 + y, 'y = 3x^2'),
+        Equation.from_description('x^2 + y^2 = 4', ('x', 'y')),
+        Equation.from_description('y = 3x^2', ('x', 'y')),
     ],
     2: [
-        Equation(lambda x, y: np.tan(x * y + 0.3) - x**2, 'tg(x * y + 0.3) - x^2 = 0'),
-        Equation(lambda x, y: 0.9 * x**2 + 2 * y**2 - 1, '0.9 * x^2 + 2 * y^2 - 1 = 0'),
+        Equation.from_description('tg(x * y + 0.3) - x^2 = 0', ('x', 'y')),
+        Equation.from_description('0.9 * x^2 + 2 * y^2 - 1 = 0', ('x', 'y')),
     ]
 }
 
+
+def add_from_file(path):
+    """
+    Добавляет к встроенным уравнениям и системам загруженные из файла (см. load_equations).
+    """
+    for item in load_equations(path):
+        if isinstance(item, list):
+            systems[len(systems) + 1] = item
+        else:
+            equations[len(equations) + 1] = item
+
 def plot_function(f, a, b, root=None):
     """
     Построение графика f(x) на интервале [a,b].
@@ -96,7 +112,8 @@ def main():
     print("Выберите режим:")
     print("1 - Решение нелинейного уравнения")
     print("2 - Решение системы нелинейных уравнений (Методом Ньютона)")
-    mode = input("Ваш выбор (1/2): ").strip()
+    print("3 - Поиск всех корней уравнения на отрезке")
+    mode = input("Ваш выбор (1/2/3): ").strip()
 
     if mode == "1":
         # -----------------------
@@ -133,9 +150,10 @@ def main():
         print("1 - Хорд")
         print("2 - Секущих")
         print("3 - Простой итерации")
+        print("5 - Брента")
         method_choice = int(input("Ваш выбор: ").strip())
 
-        if method_choice != 1 and method_choice != 2 and method_choice != 3:
+        if method_choice not in (1, 2, 3, 5):
             print("Нет такого метода")
             return
 
@@ -150,6 +168,14 @@ def main():
         print(f"Найден корень: x = {root}")
         print(f"f(x) = {f_root}")
         print(f"Число итераций: {iters}")
+        print(f"Вычислений функции: {res.evaluations}")
+
+        # Для многочлена проверяем по собственным числам сопровождающей матрицы
+        if isinstance(equation, PolynomialEquation):
+            exact = equation.real_roots(a, b, eps)
+            if exact.size > 0:
+                nearest = exact[np.argmin(np.abs(exact - root))]
+                print(f"Корень по сопровождающей матрице: {nearest} (расхождение {abs(root - nearest)})")
 
         # Хотим ли вывод в файл или на экран? Уже вывели на экран;
         # для примера покажем простую запись в файл:
@@ -186,8 +212,10 @@ def main():
         print("Введите точность eps:")
         eps = float(input("eps = "))
 
+        broyden = input("Использовать метод Бройдена (якобиан не пересчитывается)? (y/n): ").strip().lower() == "y"
+
         # Метод Ньютона для системы
-        methode = methods[4](sys, eps)
+        methode = methods[4](sys, eps, broyden=broyden)
         res = methode.solve()
 
         iters = res.iterations
@@ -196,6 +224,13 @@ def main():
 
         print(f"Решение системы: (x, y) = ({x}, {y}")
         print(f"Число итераций: {iters}")
+        print(f"Вычислений функций: {res.evaluations}")
+
+        all_solutions = solve_all(sys, eps, broyden=broyden)
+        if len(all_solutions) > 1:
+            print("Все решения в области [-2, 2] x [-2, 2]:")
+            for other in all_solutions:
+                print(f"  (x, y) = ({other.x}, {other.y}), итераций: {other.iterations}")
 
         # Вывод в файл?
         save_choice = input("Сохранить результат в файл? (y/n): ").strip().lower()
@@ -210,9 +245,39 @@ def main():
         # Пользователь может задать диапазон для построения,
         # здесь для примера возьмём [-5,5] x [-5,5].
         plot_system(f1, f2, x_range=(-5, 5), y_range=(-5, 5), solution=[x, y])
+    elif mode == "3":
+        # -----------------------
+        # ВСЕ КОРНИ НА ОТРЕЗКЕ
+        # -----------------------
+        print("Список доступных функций:")
+        for k, eq in equations.items():
+            print(f"{k}) f(x) = {eq.description}")
+        choice = int(input("Выберите номер функции: "))
+        if choice not in equations:
+            print("Нет такой функции.")
+            return
+        equation = equations[choice]
+
+        print("Введите отрезок поиска [a, b]:")
+        a = float(input("a = "))
+        b = float(input("b = "))
+        eps = float(input("eps = "))
+
+        roots = find_all_roots(equation, a, b, eps)
+        if roots.size == 0:
+            print("На отрезке корней не найдено.")
+            return
+        for root in roots:
+            print(f"x = {root}, f(x) = {equation(root)}")
+
+        plot_function(equation.function, a, b)
     else:
         print("Неверный выбор режима.")
 
 
 if __name__ == "__main__":
+    import sys
+    # python main.py [файл с уравнениями]
+    for path in sys.argv[1:]:
+        add_from_file(path)
     main()
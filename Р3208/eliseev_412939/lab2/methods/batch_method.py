@@ -0,0 +1,150 @@
+from typing import Callable
+
+import numpy as np
+
+from dto.batch_result import BatchResult
+from methods.method import MAX_ITERATIONS
+
+
+def horner(coefficients: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """
+    Значения многочленов по схеме Горнера, у каждой полосы свои коэффициенты.
+    :param coefficients: матрица (m, k), в строке коэффициенты от старшей степени к младшей
+    :param x: точки (m,), по одной на многочлен
+    """
+    result = np.zeros_like(x, dtype=float)
+    for c in coefficients.T:
+        result = result * x + c
+    return result
+
+
+class BatchMethod:
+    """
+    Класс для пакетного решения: много уравнений/интервалов сразу, все итерации на массивах NumPy.
+    Каждое уравнение — отдельная полоса со своей проверкой точности:
+    сошедшиеся полосы выпадают из маски и дальше не считаются.
+    """
+    name = 'Пакетный метод'
+    kinds = ('chord', 'secant')
+
+    def __init__(self, function: Callable, a, b, eps: float, kind: str = 'chord'):
+        """
+        :param function: f(x, lanes) — значения f в точках x для полос с номерами lanes
+        :param a: левые границы интервалов (массив или число)
+        :param b: правые границы интервалов (массив или число)
+        :param eps: точность
+        :param kind: 'chord' — метод хорд, 'secant' — метод секущих
+        """
+        if kind not in self.kinds:
+            raise ValueError(f"kind должен быть одним из {self.kinds}")
+        self.a, self.b = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float))
+        self.a, self.b = self.a.ravel().copy(), self.b.ravel().copy()
+        self.function = function
+        self.eps = eps
+        self.kind = kind
+
+    @classmethod
+    def for_function(cls, f: Callable, a, b, eps: float, kind: str = 'chord'):
+        """
+        Одна векторизованная функция f(x) на многих интервалах [a_i, b_i].
+        """
+        return cls(lambda x, lanes: f(x), a, b, eps, kind)
+
+    @classmethod
+    def for_coefficients(cls, coefficients, a, b, eps: float, kind: str = 'chord'):
+        """
+        Много многочленов сразу: coefficients — матрица (m, k), от старшей степени к младшей.
+        """
+        coefficients = np.atleast_2d(np.asarray(coefficients, dtype=float))
+        method = cls(lambda x, lanes: horner(coefficients[lanes], x), a, b, eps, kind)
+        if method.a.size == 1:
+            method.a = np.full(len(coefficients), method.a[0])
+            method.b = np.full(len(coefficients), method.b[0])
+        return method
+
+    def solve(self) -> BatchResult:
+        """
+        Метод для запуска решения
+        :return: Результат решения — объект BatchResult
+        """
+        if self.kind == 'chord':
+            return self._chord()
+        return self._secant()
+
+    def _chord(self) -> BatchResult:
+        """
+        Метод хорд (как в ChordMethod), только для всех полос сразу:
+        x = (a * f(b) - b * f(a)) / (f(b) - f(a)), затем выбираем половину отрезка со сменой знака.
+        """
+        f = self.function
+        a, b = self.a.copy(), self.b.copy()
+        m = a.size
+        lanes = np.arange(m)
+
+        fa, fb = f(a, lanes), f(b, lanes)
+        x = (a * fb - b * fa) / (fb - fa)
+        fx = f(x, lanes)
+
+        iterations = np.zeros(m, dtype=int)
+        converged = np.zeros(m, dtype=bool)
+        active = lanes
+
+        while active.size > 0 and iterations[active[0]] < MAX_ITERATIONS:
+            iterations[active] += 1
+
+            # Обновляем границы
+            left = fa[active] * fx[active] <= 0
+            b[active] = np.where(left, x[active], b[active])
+            fb[active] = np.where(left, fx[active], fb[active])
+            a[active] = np.where(left, a[active], x[active])
+            fa[active] = np.where(left, fa[active], fx[active])
+
+            new_x = (a[active] * fb[active] - b[active] * fa[active]) / (fb[active] - fa[active])
+            delta = np.abs(new_x - x[active])
+
+            x[active] = new_x
+            # Проверяем достижение необходимой точности
+            done = delta < self.eps
+            converged[active[done]] = True
+            active = active[~done]
+            if active.size > 0:
+                fx[active] = f(x[active], active)
+
+        return BatchResult(x, iterations, converged)
+
+    def _secant(self) -> BatchResult:
+        """
+        Метод секущих для всех полос сразу, начальные точки x0 = a, x1 = b:
+        x = x1 - f(x1) * (x1 - x0) / (f(x1) - f(x0))
+        """
+        f = self.function
+        x0, x1 = self.a.copy(), self.b.copy()
+        m = x0.size
+        lanes = np.arange(m)
+
+        f0, f1 = f(x0, lanes), f(x1, lanes)
+
+        iterations = np.zeros(m, dtype=int)
+        converged = np.zeros(m, dtype=bool)
+        active = lanes
+
+        while active.size > 0 and iterations[active[0]] < MAX_ITERATIONS:
+            iterations[active] += 1
+
+            denominator = f1[active] - f0[active]
+            flat = denominator == 0
+            step = f1[active] * (x1[active] - x0[active]) / np.where(flat, 1.0, denominator)
+            step[flat] = 0.0
+            x = x1[active] - step
+
+            x0[active], f0[active] = x1[active], f1[active]
+            x1[active] = x
+
+            # Проверяем достижение необходимой точности (или секущая стала горизонтальной)
+            done = (np.abs(step) < self.eps) | flat
+            converged[active[done]] = ~flat[done] | (f1[active[done]] == 0)
+            active = active[~done]
+            if active.size > 0:
+                f1[active] = f(x1[active], active)
+
+        return BatchResult(x1, iterations, converged)
@@ -0,0 +1,87 @@
+import math
+import sys
+
+from dto.result import Result
+from methods.method import Method, MAX_ITERATIONS
+
+
+class BrentMethod(Method):
+    """
+    Класс для реализации метода Брента (гибрид половинного деления, секущих и обратной квадратичной интерполяции)
+    """
+    name = 'Метод Брента'
+
+    def solve(self) -> Result:
+        """
+        Метод Брента:
+        1. всё время держим отрезок [b, c], на концах которого функция имеет разные знаки, b — лучшее приближение
+        2. пробуем шаг обратной квадратичной интерполяции по трём последним точкам (или секущей, если точки две)
+        3. если шаг выводит за отрезок или уменьшает его слишком медленно — делаем половинное деление
+        4. повторяем, пока половина отрезка не станет меньше eps / 2
+        Корень всё время остаётся внутри отрезка, а на итерацию тратится ровно одно вычисление f.
+        :return: Результат решения — объект Result
+        """
+        f = self.equation
+        start_evaluations = f.evaluations
+        a, b = self.a, self.b
+        eps = self.eps
+        iterations = 0
+
+        fa, fb = f(a), f(b)
+        if fa * fb > 0:
+            raise Exception('На концах отрезка функция должна иметь разные знаки')
+
+        c, fc = a, fa
+        d = e = b - a
+
+        while True:
+            if iterations == MAX_ITERATIONS:
+                raise Exception(f'Выполнено {MAX_ITERATIONS} итераций. Решение н найдено')
+            iterations += 1
+
+            # Корень должен быть между b и c
+            if fb * fc > 0:
+                c, fc = a, fa
+                d = e = b - a
+            # b — лучшее из приближений
+            if abs(fc) < abs(fb):
+                a, b, c = b, c, b
+                fa, fb, fc = fb, fc, fb
+
+            tol = 2 * sys.float_info.epsilon * abs(b) + eps / 2
+            m = (c - b) / 2
+
+            # Проверяем достижение необходимой точности
+            if abs(m) <= tol or fb == 0:
+                break
+
+            if abs(e) >= tol and abs(fa) > abs(fb):
+                s = fb / fa
+                if a == c:
+                    # секущая
+                    p = 2 * m * s
+                    q = 1 - s
+                else:
+                    # обратная квадратичная интерполяция
+                    q = fa / fc
+                    r = fb / fc
+                    p = s * (2 * m * q * (q - r) - (b - a) * (r - 1))
+                    q = (q - 1) * (r - 1) * (s - 1)
+                if p > 0:
+                    q = -q
+                else:
+                    p = -p
+
+                # шаг принимаем, только если он внутри отрезка и быстрее половинного деления
+                if 2 * p < min(3 * m * q - abs(tol * q), abs(e * q)):
+                    e, d = d, p / q
+                else:
+                    d = e = m
+            else:
+                d = e = m
+
+            a, fa = b, fb
+            b += d if abs(d) > tol else math.copysign(tol, m)
+            fb = f(b)
+
+        return Result(b, iterations, evaluations=f.evaluations - start_evaluations)
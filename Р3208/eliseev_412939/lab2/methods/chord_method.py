@@ -18,13 +18,18 @@ class ChordMethod(Method):
         5. вычисляем x1 и т. д. (повторяем шаги 2-4)
         :return: Результат решения — объект Result
         """
-        f = self.equation.function
+        f = self.equation
+        start_evaluations = f.evaluations
         a, b = self.a, self.b
         eps = self.eps
         iterations = 0
 
+        # Значения на концах запоминаем, на каждой итерации считаем f только в новой точке
+        fa, fb = f(a), f(b)
+
         # Формула хорд
-        x = (a * f(b) - b * f(a)) / (f(b) - f(a))
+        x = (a * fb - b * fa) / (fb - fa)
+        fx = f(x)
 
         while True:
             if iterations == MAX_ITERATIONS:
@@ -32,12 +37,12 @@ class ChordMethod(Method):
             iterations += 1
 
             # Обновляем границы
-            if f(a) * f(x) <= 0:
-                b = x
+            if fa * fx <= 0:
+                b, fb = x, fx
             else:
-                a = x
+                a, fa = x, fx
 
-            new_x = (a * f(b) - b * f(a)) / (f(b) - f(a))
+            new_x = (a * fb - b * fa) / (fb - fa)
             delta = abs(new_x - x)
 
             # Проверяем достижение необходимой точности
@@ -45,5 +50,6 @@ class ChordMethod(Method):
                 break
 
             x = new_x
+            fx = f(x)
 
-        return Result(x, iterations)
\ No newline at end of file
+        return Result(x, iterations, evaluations=f.evaluations - start_evaluations)
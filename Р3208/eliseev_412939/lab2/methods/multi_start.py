@@ -0,0 +1,100 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from scipy import ndimage
+
+from dto.equation import Equation, system_from_descriptions
+from dto.result import Result
+from methods.newton_method import NewtonMethod
+
+
+def find_initial_approximations(system: list[Equation], ranges=None, step=0.1, threshold=0.5) -> list[np.ndarray]:
+    """
+    Ищет сразу все начальные приближения для системы из N уравнений.
+    1. Невязки всех уравнений считаются на всей сетке за один проход (broadcasting по meshgrid).
+    2. Кандидаты — точки сетки, где max|f_i| < threshold и это локальный минимум невязки;
+       соседние кандидаты склеиваем в кластеры.
+    3. Из каждого кластера берём точку с наименьшей невязкой.
+    :param system: система уравнений f_i(x_1, ..., x_N)
+    :param ranges: список диапазонов (lo, hi) по каждой переменной, по умолчанию (-2, 2)
+    :param step: шаг сетки
+    :param threshold: максимальная невязка для точки-кандидата
+    :return: список начальных приближений, по одному на кластер
+    """
+    if ranges is None:
+        ranges = [(-2, 2)] * len(system)
+
+    axes = [np.arange(lo, hi, step) for lo, hi in ranges]
+    grid = np.meshgrid(*axes, indexing='ij')
+
+    norm = np.zeros(grid[0].shape)
+    for eq in system:
+        norm = np.maximum(norm, np.abs(eq(*grid)))
+
+    # кандидаты — локальные минимумы невязки, соседние минимумы (плато) склеиваем в один кластер
+    candidates = (norm < threshold) & (norm == ndimage.minimum_filter(norm, size=3, mode='nearest'))
+    labels, clusters = ndimage.label(candidates, structure=np.ones((3,) * norm.ndim))
+    if clusters == 0:
+        return []
+
+    best = ndimage.minimum_position(norm, labels, index=np.arange(1, clusters + 1))
+    return [np.array([axis[i] for axis, i in zip(axes, idx)]) for idx in best]
+
+
+def _solve_from(system: list[Equation], eps: float, x0: np.ndarray, broyden: bool):
+    # у каждого запуска свои копии уравнений — кэш значений и счётчик вычислений не общие
+    local = [Equation(eq.function, eq.description) for eq in system]
+    try:
+        return NewtonMethod(local, eps, x0=x0, broyden=broyden).solve()
+    except Exception:
+        return None
+
+
+def _solve_from_descriptions(descriptions: list[str], eps: float, x0: np.ndarray, broyden: bool):
+    # в процессе-воркере: лямбды через pickle не передать, поэтому систему собираем заново по описаниям
+    return _solve_from(system_from_descriptions(descriptions), eps, x0, broyden)
+
+
+def _rebuildable(system: list[Equation], descriptions: list[str]) -> bool:
+    """
+    Получится ли собрать ту же систему по описаниям: описания разбираются, переменных столько же,
+    сколько уравнений, и в пробной точке значения совпадают с исходными функциями.
+    """
+    try:
+        rebuilt = system_from_descriptions(descriptions)
+        point = np.linspace(0.31, 0.73, len(system))
+        return all(np.isclose(new.function(*point), old.function(*point)) for new, old in zip(rebuilt, system))
+    except (ValueError, SyntaxError, TypeError):
+        return False
+
+
+def solve_all(system: list[Equation], eps: float, ranges=None, step=0.1, threshold=0.5,
+              broyden: bool = False, workers: int = 1, tol=1e-4) -> list[Result]:
+    """
+    Все различные решения системы в заданной области:
+    метод Ньютона запускается из каждого кластера начальных приближений,
+    совпадающие (ближе tol) решения склеиваются, несошедшиеся запуски отбрасываются.
+    При workers > 1 запуски идут на пуле процессов (в потоках чистый питон упирается в GIL);
+    это возможно, только если систему можно собрать заново по описаниям, иначе считаем по очереди.
+    Для пары-тройки стартов запуск процессов дороже самих итераций, поэтому по умолчанию workers = 1.
+    :return: список результатов, по одному на каждое найденное решение
+    """
+    starts = find_initial_approximations(system, ranges, step, threshold)
+
+    descriptions = [eq.description for eq in system]
+    if workers > 1 and _rebuildable(system, descriptions):
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_solve_from_descriptions, [descriptions] * len(starts), [eps] * len(starts),
+                                    starts, [broyden] * len(starts)))
+    else:
+        results = [_solve_from(system, eps, x0, broyden) for x0 in starts]
+
+    distinct = []
+    for res in results:
+        if res is None:
+            continue
+        v = np.array(res.vector)
+        if all(np.max(np.abs(v - np.array(other.vector))) >= tol for other in distinct):
+            distinct.append(res)
+
+    return distinct
@@ -1,3 +1,5 @@
+from typing import Callable, Union
+
 import numpy as np
 from dto.equation import Equation
 from dto.result import Result
@@ -7,6 +9,8 @@ from methods.method import MAX_ITERATIONS
 def find_initial_approximation(system, x_range=(-2, 2), y_range=(-2, 2), step=0.1, threshold=0.5):
     """
     Автоматически ищет приближение (x, y)
+    Вся сетка считается за один проход массивами, берём первую (в порядке обхода по x, потом по y)
+    точку, где обе невязки меньше threshold.
     :param system: система уравнений
     :param x_range: диапазон по x
     :param y_range: диапазон по y
@@ -14,89 +18,135 @@ def find_initial_approximation(system, x_range=(-2, 2), y_range=(-2, 2), step=0.
     :param threshold: максимальное значение |f(x, y)| и |g(x, y)| для выбора точки
     :return: (x0, y0) — подходящее приближение
     """
-    f = system[0].function
-    g = system[1].function
+    X, Y = np.meshgrid(np.arange(x_range[0], x_range[1], step),
+                       np.arange(y_range[0], y_range[1], step), indexing='ij')
+
+    good = np.ones(X.shape, dtype=bool)
+    for eq in system:
+        good &= np.abs(eq.function(X, Y)) < threshold
+
+    candidates = np.argwhere(good)
+    if candidates.size == 0:
+        raise Exception("Не удалось найти начальное приближение. Попробуйте увеличить диапазон или threshold.")
 
-    for x in np.arange(x_range[0], x_range[1], step):
-        for y in np.arange(y_range[0], y_range[1], step):
-            if abs(f(x, y)) < threshold and abs(g(x, y)) < threshold:
-                return x, y
+    i, j = candidates[0]
+    return X[i, j], Y[i, j]
 
-    raise Exception("Не удалось найти начальное приближение. Попробуйте увеличить диапазон или threshold.")
 
-def create_jacobian(x, y, system, h=1e-6):
+def residual(system: Union[list[Equation], Callable]) -> Callable:
     """
-    Строит якобиан для системы из двух уравнений
-    :param x, y: начальные приближения
-    :param system: система уравнений
-    :param h: шаг для численного дифференцирования (по умолчанию 1e-6)
-    :return: якобиан 2x2
+    Вектор-функция невязки F(v) для системы из N уравнений.
+    :param system: список уравнений f_i(x_1, ..., x_N) или уже готовая функция F(v) -> массив из N чисел
+    :return: F(v) -> np.ndarray
     """
-    f = system[0].function
-    g = system[1].function
+    if callable(system) and not isinstance(system, Equation):
+        return lambda v: np.asarray(system(v), dtype=float)
+    return lambda v: np.array([eq(*v) for eq in system], dtype=float)
 
-    # частные производные по x, y для функции f(x, y)
-    fx_ = (f(x + h, y) - f(x, y)) / h
-    fy_ = (f(x, y + h) - f(x, y)) / h
 
-    # частные производные по x, y для функции g(x, y)
-    gx_ = (g(x + h, y) - g(x, y)) / h
-    gy_ = (g(x, y + h) - g(x, y)) / h
+def create_jacobian(v, F, Fv=None, h=1e-6):
+    """
+    Строит якобиан системы из N уравнений конечными разностями вперёд
+    :param v: точка (вектор из N чисел)
+    :param F: вектор-функция невязки
+    :param Fv: уже посчитанное F(v), чтобы не считать его ещё раз
+    :param h: шаг для численного дифференцирования (по умолчанию 1e-6)
+    :return: якобиан NxN (N вычислений F)
+    """
+    v = np.asarray(v, dtype=float)
+    if Fv is None:
+        Fv = F(v)
 
-    jac = [
-        [fx_, fy_],
-        [gx_, gy_],
-    ]
+    jac = np.empty((Fv.size, v.size))
+    for j in range(v.size):
+        shifted = v.copy()
+        shifted[j] += h
+        jac[:, j] = (F(shifted) - Fv) / h
 
     return jac
 
+
 class NewtonMethod:
     """
     Класс для реализации метода Ньютона
     """
     name = "Метод Ньютона"
 
-    def __init__(self, system: list[Equation], eps: float):
+    def __init__(self, system: Union[list[Equation], Callable], eps: float, x0=None, broyden: bool = False):
+        """
+        :param system: список из N уравнений или вектор-функция F(v)
+        :param eps: точность
+        :param x0: начальное приближение (для систем из двух уравнений можно не задавать — найдём сами)
+        :param broyden: True — квазиньютоновский метод Бройдена (якобиан считается один раз, дальше обновляется)
+        """
         self.system = system
-        self.x0, self.y0 = find_initial_approximation(system)
+        if x0 is None:
+            x0 = find_initial_approximation(system)
+        self.x0 = np.asarray(x0, dtype=float)
         self.eps = eps
-
+        self.broyden = broyden
 
     def solve(self) -> Result:
         """
         Метод Ньютона:
         функция f(x) на отрезке [a, b] заменяется касательной и в качестве приближённого значения корня
         принимается точка пересечения касательной с осью абсцисс.
+        Для системы: J(v) * delta = -F(v), v = v + delta.
+        В режиме Бройдена вместо пересчёта якобиана обновляем обратный к нему (формула Шермана-Моррисона):
+            H += (delta - H dF) (delta^T H) / (delta^T H dF),  dF = F(v + delta) - F(v),
+        так что на итерацию уходит одно вычисление F вместо N + 1.
         :return:
         """
-        system = self.system
-        v = [self.x0, self.y0]  # Текущая точка (вектор)
+        evaluations = 0
+        F_raw = residual(self.system)
+
+        def F(point):
+            nonlocal evaluations
+            evaluations += 1
+            return F_raw(point)
+
+        v = self.x0.copy()  # Текущая точка (вектор)
         eps = self.eps
         iteration = 0
 
+        Fv = F(v)
+        H = None
+        if self.broyden:
+            jac = create_jacobian(v, F, Fv)
+            try:
+                H = np.linalg.inv(jac)
+            except np.linalg.LinAlgError:
+                raise Exception(f'Ошибка применения метода: Якобиан вырожден. Якобиан->{jac.tolist()}')
 
         while True:
             if iteration >= MAX_ITERATIONS:
                 raise Exception(f'Выполнено {MAX_ITERATIONS} итераций. Решение не найдено.')
             iteration += 1
 
-            jac = create_jacobian(v[0], v[1], system)
-
-            f = system[0].function(v[0], v[1])
-            g = system[1].function(v[0], v[1])
-
-            F = [f, g]
-
-            try:
-                delta = np.linalg.solve(np.array(jac), -1 * np.array(F))
-            except np.linalg.LinAlgError:
-                raise Exception(f'Ошибка применения метода: Якобиан вырожден. Итерация->{iteration} Якобиан->{jac}')
+            if H is not None:
+                delta = -(H @ Fv)
+            else:
+                jac = create_jacobian(v, F, Fv)
+                try:
+                    delta = np.linalg.solve(jac, -Fv)
+                except np.linalg.LinAlgError:
+                    raise Exception(f'Ошибка применения метода: Якобиан вырожден. Итерация->{iteration} Якобиан->{jac.tolist()}')
 
             if np.max(np.abs(delta)) < eps:
                 break
 
-            next_v = v + delta
+            v = v + delta
+            F_next = F(v)
+
+            if H is not None:
+                dF = F_next - Fv
+                Hy = H @ dF
+                denominator = delta @ Hy
+                if denominator == 0:
+                    raise Exception(f'Ошибка применения метода: обновление Бройдена вырождено. Итерация->{iteration}')
+                H += np.outer(delta - Hy, delta @ H) / denominator
 
-            v = next_v.tolist()
+            Fv = F_next
 
-        return Result(v[0], iteration, v[1])
\ No newline at end of file
+        y = v[1] if v.size > 1 else None
+        return Result(v[0], iteration, y, evaluations, v.tolist())
@@ -0,0 +1,72 @@
+import numpy as np
+
+from dto.equation import Equation
+from dto.polynomial_equation import PolynomialEquation
+from methods.batch_method import BatchMethod
+
+GRID_POINTS = 1000
+REFINE_STEPS = 10
+
+
+def evaluate_on_grid(equation: Equation, x: np.ndarray) -> np.ndarray:
+    """
+    Значения функции сразу во всех точках массива.
+    Если функция не умеет работать с массивами (math.sin, лямбда с if и т.п.), считаем поточечно.
+    """
+    try:
+        y = np.asarray(equation(x), dtype=float)
+        if y.shape == x.shape:
+            return y
+    except (TypeError, ValueError):
+        pass
+    return np.array([equation(float(xi)) for xi in x], dtype=float)
+
+
+def isolate_roots(equation: Equation, lo: float, hi: float, points: int = GRID_POINTS,
+                  refine: int = REFINE_STEPS):
+    """
+    Отделение корней: один проход по сетке из points отрезков на [lo, hi], ищем все смены знака.
+    Каждый найденный отрезок затем сужаем refine шагами половинного деления (все отрезки сразу).
+    Корни чётной кратности (касание оси без смены знака) так не находятся.
+    :return: (a, b, exact) — массивы границ отрезков со сменой знака и массив точек сетки, где f ровно 0
+    """
+    x = np.linspace(lo, hi, points + 1)
+    y = evaluate_on_grid(equation, x)
+
+    exact = x[y == 0]
+    change = np.flatnonzero(y[:-1] * y[1:] < 0)
+    a, b = x[change], x[change + 1]
+    fa = y[change]
+
+    for _ in range(refine):
+        if a.size == 0:
+            break
+        mid = (a + b) / 2
+        fm = evaluate_on_grid(equation, mid)
+        left = fa * fm <= 0
+        b = np.where(left, mid, b)
+        a = np.where(left, a, mid)
+        fa = np.where(left, fa, fm)
+
+    return a, b, exact
+
+
+def find_all_roots(equation: Equation, lo: float, hi: float, eps: float, points: int = GRID_POINTS,
+                   refine: int = REFINE_STEPS) -> np.ndarray:
+    """
+    Все корни уравнения на [lo, hi] без ручного подбора интервалов:
+    отделяем корни по сетке, а потом уточняем все отрезки одновременно пакетным методом хорд.
+    Для многочлена корни сразу берутся из сопровождающей матрицы.
+    :return: отсортированный массив корней
+    """
+    if isinstance(equation, PolynomialEquation):
+        return equation.real_roots(lo, hi, eps)
+
+    a, b, exact = isolate_roots(equation, lo, hi, points, refine)
+
+    roots = exact
+    if a.size > 0:
+        result = BatchMethod.for_function(lambda x: evaluate_on_grid(equation, x), a, b, eps, 'chord').solve()
+        roots = np.concatenate([roots, result.roots])
+
+    return np.sort(roots)
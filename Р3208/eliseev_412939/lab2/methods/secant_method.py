@@ -1,4 +1,3 @@
-from scipy.differentiate import derivative
 from dto.result import Result
 from methods.method import Method, MAX_ITERATIONS
 
@@ -17,14 +16,15 @@ class SecantMethod(Method):
         - x_1 выбирается рядом с начальным самостоятельно, например x_1 = x_0 + eps
         :return: Результат решения — объект Result
         """
-        f = self.equation.function
+        f = self.equation
+        start_evaluations = f.evaluations
         a = self.a
         b = self.b
         eps = self.eps
         iterations = 0
 
-        fa_ = derivative(f, a).df
-        fb_ = derivative(f, b).df
+        fa_ = f.df(a)
+        fb_ = f.df(b)
 
         # Проверяем условие сходимости метода
         if fa_ * fb_ < 0:
@@ -38,19 +38,23 @@ class SecantMethod(Method):
 
         x1 = x0 + eps
 
+        # f в двух последних точках запоминаем, за итерацию считаем только f(x1)
+        f0, f1 = f(x0), f(x1)
+
         while True:
             if iterations == MAX_ITERATIONS:
                 raise Exception(f'Выполнено {MAX_ITERATIONS} итераций. Решение н найдено')
             iterations += 1
 
-            x = x1 - f(x1) * (x1 - x0) / (f(x1) - f(x0))
+            x = x1 - f1 * (x1 - x0) / (f1 - f0)
             delta = abs(x - x1)
 
             # Проверяем достижение необходимой точности
             if delta < eps:
                 break
 
-            x0 = x1
+            x0, f0 = x1, f1
             x1 = x
+            f1 = f(x1)
 
-        return Result(x, iterations)
+        return Result(x, iterations, evaluations=f.evaluations - start_evaluations)
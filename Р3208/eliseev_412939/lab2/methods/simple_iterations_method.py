@@ -1,7 +1,37 @@
 import numpy as np
-from scipy.differentiate import derivative
 from dto.result import Result
 from methods.method import Method, MAX_ITERATIONS
+from methods.root_isolation import evaluate_on_grid
+
+
+def estimate_max_abs(g, a: float, b: float, samples: int = 32, keep: int = 3, rounds: int = 4) -> float:
+    """
+    Оценка max|g(x)| на [a, b] при фиксированном числе вычислений g (не зависит от eps):
+    1. грубо считаем |g| на samples точках (всё массивами);
+    2. берём keep самых больших значений и вокруг каждого считаем ещё 5 точек на отрезке
+       в один шаг сетки, шаг каждый раунд уменьшаем — и так rounds раундов.
+    Всего samples + rounds * keep * 5 вычислений g.
+    """
+    x = np.linspace(a, b, samples)
+    values = np.abs(evaluate_on_grid(g, x))
+    width = (b - a) / (samples - 1)
+
+    for _ in range(rounds):
+        best = x[np.argsort(values)[-keep:]]
+        local = np.clip((best[:, None] + np.linspace(-width, width, 5)).ravel(), a, b)
+        x = np.concatenate([x, local])
+        values = np.concatenate([values, np.abs(evaluate_on_grid(g, local))])
+        width /= 2.5
+
+    return float(np.max(values))
+
+
+def estimate_max_derivative(g, a: float, b: float, h: float = 1e-6, **kwargs) -> float:
+    """
+    Оценка max|g'(x)| на [a, b], производная — центральной разностью (2 вычисления g на точку).
+    """
+    return estimate_max_abs(lambda x: (evaluate_on_grid(g, x + h) - evaluate_on_grid(g, x - h)) / (2 * h),
+                            a, b, **kwargs)
 
 
 class SimpleIterationsMethod(Method):
@@ -19,23 +49,26 @@ class SimpleIterationsMethod(Method):
         4. высокая сходимость  обеспечивается при q = max(|phi'(x)|) примерно равное 0. Тогда _lambda = 1/max(|f'(x)|) (с минусом, если f'[a, b] > 0)
         :return: Результат решения — объект Result
         """
-        f = self.equation.function
+        f = self.equation
+        start_evaluations = f.evaluations
         a = self.a
         b = self.b
         eps = self.eps
         iterations = 0
 
-        fa_ = derivative(f, a).df
-        fb_ = derivative(f, b).df
+        fa_ = f.df(a)
+        fb_ = f.df(b)
 
         max_derivative = max(abs(fa_), abs(fb_))
         _lambda = 1 / max_derivative
         if fa_ > 0: _lambda *= -1
 
         phi = lambda x: x + _lambda * f(x)
-        phi_ = lambda x: derivative(phi, x).df
 
-        q = np.max(abs(phi_(np.linspace(a, b, int(1 / eps)))))
+        if f.derivative is not None:
+            q = estimate_max_abs(lambda x: 1 + _lambda * f.df(x), a, b)
+        else:
+            q = estimate_max_derivative(phi, a, b)
         if q > 1:
             raise Exception(f'Метод не сходится, так как q >= 1')
 
@@ -54,4 +87,4 @@ class SimpleIterationsMethod(Method):
 
             prev_x = x
 
-        return Result(x, iterations)
\ No newline at end of file
+        return Result(x, iterations, evaluations=f.evaluations - start_evaluations)
\ No newline at end of file
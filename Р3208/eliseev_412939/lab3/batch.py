@@ -0,0 +1,214 @@
+import argparse
+import ast
+import csv
+import multiprocessing as mp
+import pickle
+import time
+
+import numpy as np
+
+from function import Function
+from main import functions, romberg_integration, runge_integration
+from methods.adaptive_simpson import adaptive_integration
+from methods.gauss_method import ClenshawCurtisMethod, GaussLegendreMethod
+from methods.rectangle_method import RectangleMethod
+from methods.simpson_method import SimpsonMethod
+from methods.trapezoid_method import TrapezoidMethod
+
+# Пакетное интегрирование: много заданий (f, a, b, метод, eps) на пуле процессов.
+#   python batch.py jobs.csv -o results.csv -w 8 --chunksize 16
+# В jobs.csv столбцы function, a, b, method, eps; function — номер из functions
+# или выражение от x на numpy ('exp(-2 * x) * sin(x)').
+
+# Что можно писать в выражении: x, числа, арифметика и эти функции/константы
+FUNCTIONS = {name: getattr(np, name) for name in ('sin', 'cos', 'tan', 'exp', 'log', 'sqrt', 'abs', 'sinh', 'cosh',
+                                                   'tanh', 'arcsin', 'arccos', 'arctan')}
+CONSTANTS = {'pi': np.pi, 'e': np.e}
+ALLOWED_NODES = (ast.Expression, ast.BinOp, ast.UnaryOp, ast.Call, ast.Name, ast.Constant, ast.Load,
+                 ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.USub, ast.UAdd)
+
+methods = {
+    'left': lambda: RectangleMethod(mode='left'),
+    'right': lambda: RectangleMethod(mode='right'),
+    'middle': lambda: RectangleMethod(mode='middle'),
+    'trapezoid': TrapezoidMethod,
+    'simpson': SimpsonMethod,
+    'gauss': GaussLegendreMethod,
+    'clenshaw_curtis': ClenshawCurtisMethod,
+}
+# эти методы сами подбирают разбиение, правило Рунге им не нужно
+drivers = {
+    'romberg': romberg_integration,
+    'adaptive': adaptive_integration,
+}
+
+result_dtype = np.dtype([
+    ('value', 'f8'),
+    ('n_final', 'i8'),
+    ('evaluations', 'i8'),  # -1, если f не Function и вычисления не считались
+    ('time', 'f8'),
+    ('ok', '?'),
+])
+
+# Задания, которые дочерние процессы получают при fork вместе с памятью родителя:
+# так можно передавать и лямбды с замыканиями, которые не сериализуются pickle.
+_jobs = []
+
+
+def integrate_job(f, a, b, method, eps):
+    """
+    Одно задание. :return: (значение, n_final, вычислений, время)
+    """
+    if method not in methods and method not in drivers:
+        raise ValueError(f"неизвестный метод '{method}'")
+    if isinstance(f, Function):
+        f.reset()
+    start = time.perf_counter()
+    if method in drivers:
+        value, n_final = drivers[method](f, a, b, eps)
+    else:
+        value, n_final = runge_integration(methods[method](), f, a, b, eps)
+    elapsed = time.perf_counter() - start
+    evaluations = f.evaluations if isinstance(f, Function) else -1
+    return value, n_final, evaluations, elapsed
+
+
+def _run(job):
+    try:
+        if isinstance(job[0], (str, int)):
+            # без fork приходит не функция, а её номер или выражение — собираем её здесь
+            job = (parse_function(job[0]), *job[1:])
+        return (*integrate_job(*job), True)
+    except Exception as e:
+        print(f"задание {job[1:]} не выполнено: {type(e).__name__}: {e}")
+        return np.nan, 0, 0, 0.0, False
+
+
+def _run_index(i):
+    return _run(_jobs[i])
+
+
+def integrate_many(jobs, workers=None, chunksize=None):
+    """
+    Интегрирует список заданий (f, a, b, method, eps) на пуле процессов.
+    f — функция или её описание для parse_function (номер встроенной либо выражение от x).
+    Задания раздаются кусками по chunksize (по умолчанию ~4 куска на процесс),
+    чтобы на тысячах мелких интегралов не тратить время на пересылку по одному.
+    :return: структурированный массив result_dtype в порядке заданий
+    """
+    global _jobs
+    jobs = list(jobs)
+    workers = workers or mp.cpu_count()
+    chunksize = chunksize or max(1, len(jobs) // (4 * workers))
+    results = np.zeros(len(jobs), dtype=result_dtype)
+
+    if 'fork' in mp.get_all_start_methods():
+        _jobs = jobs
+        try:
+            with mp.get_context('fork').Pool(workers) as pool:
+                for i, row in enumerate(pool.imap(_run_index, range(len(jobs)), chunksize)):
+                    results[i] = row
+        finally:
+            _jobs = []
+    else:
+        # без fork (Windows) задания уходят через pickle, а лямбды так не передать:
+        # отправляем номер встроенной функции или выражение (f.spec от parse_function) и собираем f в воркере
+        builtin = {id(f): str(number) for number, f in functions.items()}
+        payload, sendable = [], []
+        for i, (f, *rest) in enumerate(jobs):
+            job = (builtin.get(id(f), getattr(f, 'spec', f)), *rest)
+            try:
+                pickle.dumps(job)
+            except Exception as e:
+                print(f"задание {tuple(rest)} не выполнено: функцию нельзя передать в процесс ({type(e).__name__})")
+                results[i] = (np.nan, 0, 0, 0.0, False)
+                continue
+            payload.append(job)
+            sendable.append(i)
+        with mp.Pool(workers) as pool:
+            for i, row in zip(sendable, pool.imap(_run, payload, chunksize)):
+                results[i] = row
+    return results
+
+
+def compile_expression(spec):
+    """
+    Выражение от x -> функция. Дерево разбора проверяется: только x, числа, арифметика
+    и функции из FUNCTIONS, так что из файла заданий нельзя выполнить произвольный код.
+    """
+    tree = ast.parse(spec, mode='eval')
+    for node in ast.walk(tree):
+        if not isinstance(node, ALLOWED_NODES):
+            raise ValueError(f"в выражении '{spec}' недопустимо: {ast.unparse(node)}")
+        if isinstance(node, ast.Call) and (not isinstance(node.func, ast.Name) or node.func.id not in FUNCTIONS
+                                           or len(node.args) != 1 or node.keywords):
+            raise ValueError(f"в выражении '{spec}' недопустимый вызов: {ast.unparse(node)}")
+        if isinstance(node, ast.Name) and node.id != 'x' and node.id not in FUNCTIONS and node.id not in CONSTANTS:
+            raise ValueError(f"в выражении '{spec}' неизвестное имя: {node.id}")
+        if isinstance(node, ast.Constant) and not isinstance(node.value, (int, float)):
+            raise ValueError(f"в выражении '{spec}' недопустимая константа: {node.value!r}")
+    args = ast.arguments(posonlyargs=[], args=[ast.arg('x')], kwonlyargs=[], kw_defaults=[], defaults=[])
+    code = compile(ast.fix_missing_locations(ast.Expression(ast.Lambda(args, tree.body))), '<job>', 'eval')
+    return eval(code, {'__builtins__': {}, **FUNCTIONS, **CONSTANTS})
+
+
+def parse_function(spec):
+    """
+    Номер встроенной функции или выражение от x (numpy-функции доступны без np.).
+    Возвращается новый Function со своим счётчиком вычислений; в f.spec запоминаем исходную строку,
+    чтобы при необходимости собрать ту же функцию в другом процессе.
+    """
+    spec = str(spec).strip()
+    if spec.isdigit():
+        builtin = functions[int(spec)]
+        f = Function(builtin.function, builtin.description)
+    else:
+        f = Function(compile_expression(spec), f"f(x) = {spec}")
+    f.spec = spec
+    return f
+
+
+def read_jobs(path):
+    """
+    Задания из CSV. Функция остаётся строкой (номер или выражение) и разбирается уже при выполнении,
+    так что ошибка в одном выражении портит только своё задание (ok = False), а не весь пакет.
+    """
+    with open(path, encoding='utf-8') as file:
+        return [(row['function'].strip(), float(row['a']), float(row['b']), row['method'].strip(),
+                 float(row['eps'])) for row in csv.DictReader(file)]
+
+
+def describe(f):
+    if isinstance(f, (str, int)):
+        spec = str(f)
+        return functions[int(spec)].description if spec.isdigit() and int(spec) in functions else f"f(x) = {spec}"
+    return getattr(f, 'description', '')
+
+
+def write_results(path, jobs, results):
+    with open(path, 'w', encoding='utf-8', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(['function', 'a', 'b', 'method', 'eps', *result_dtype.names])
+        for (f, a, b, method, eps), row in zip(jobs, results):
+            writer.writerow([describe(f), a, b, method, eps, *row.tolist()])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Пакетное интегрирование на пуле процессов")
+    parser.add_argument("jobs", help="CSV со столбцами function, a, b, method, eps")
+    parser.add_argument("-o", "--output", help="куда записать результаты (CSV); иначе печать")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="число процессов")
+    parser.add_argument("--chunksize", type=int, default=None, help="заданий в одной посылке процессу")
+    args = parser.parse_args()
+
+    jobs = read_jobs(args.jobs)
+    start = time.perf_counter()
+    results = integrate_many(jobs, args.workers, args.chunksize)
+    print(f"{len(jobs)} заданий за {time.perf_counter() - start:.3f} с, с ошибкой: {np.count_nonzero(~results['ok'])}")
+
+    if args.output:
+        write_results(args.output, jobs, results)
+    else:
+        for (f, a, b, method, eps), row in zip(jobs, results):
+            print(f"{describe(f):<36} [{a}; {b}] {method:<16} {row['value']:>18.10f} "
+                  f"n = {row['n_final']:<8} вычислений = {row['evaluations']:<8} {row['time']:.4f} с")
@@ -0,0 +1,59 @@
+import argparse
+import time
+
+from main import functions
+from methods.node_sum import CHUNK
+from methods.rectangle_method import RectangleMethod
+from methods.simpson_method import SimpsonMethod
+from methods.trapezoid_method import TrapezoidMethod
+
+# Замер скорости: python benchmark.py --sizes 1e6 1e7 1e8 --chunk 1048576
+# Для каждого метода печатает время и число узлов в секунду на массивах (куски по chunk узлов)
+# и, для небольших n, на скалярном цикле (функция-обёртка, которая не принимает массивы).
+
+benchmarked = {
+    "Левые прямоугольники": RectangleMethod(mode='left'),
+    "Средние прямоугольники": RectangleMethod(mode='middle'),
+    "Трапеции": TrapezoidMethod(),
+    "Симпсон": SimpsonMethod(),
+}
+
+
+def scalar_only(f):
+    """
+    Обёртка, которая ломается на массивах, — так node_sum уходит в скалярный цикл.
+    """
+    return lambda x: f(float(x))
+
+
+def measure(method_obj, f, a, b, n):
+    start = time.perf_counter()
+    value = method_obj.integrate(f, a, b, n)
+    return value, time.perf_counter() - start
+
+
+def benchmark(sizes, a=0.0, b=2.0, scalar_limit=10 ** 6, chunk=CHUNK):
+    import methods.node_sum as node_sum_module
+    node_sum_module.CHUNK = chunk
+
+    f = functions[1]
+    print(f"Функция: {f.description}, отрезок [{a}; {b}], узлов в куске: {chunk}")
+    print(f"{'метод':<24} {'n':>11} {'интеграл':>20} {'время, с':>10} {'узлов/с':>12} {'цикл, с':>10}")
+    for name, method_obj in benchmarked.items():
+        for n in sizes:
+            value, elapsed = measure(method_obj, f, a, b, n)
+            loop = ""
+            if n <= scalar_limit:
+                _, loop_elapsed = measure(method_obj, scalar_only(f), a, b, n)
+                loop = f"{loop_elapsed:.3f}"
+            print(f"{name:<24} {n:>11} {value:>20.12f} {elapsed:>10.3f} {n / elapsed:>12.3e} {loop:>10}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Скорость методов интегрирования на больших n")
+    parser.add_argument("--sizes", type=float, nargs="+", default=[1e6, 1e7, 1e8], help="числа разбиений")
+    parser.add_argument("--chunk", type=int, default=CHUNK, help="узлов в одном куске")
+    parser.add_argument("--scalar-limit", type=float, default=1e6, help="до какого n замерять и скалярный цикл")
+    args = parser.parse_args()
+
+    benchmark([int(n) for n in args.sizes], scalar_limit=args.scalar_limit, chunk=args.chunk)
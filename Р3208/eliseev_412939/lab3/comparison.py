@@ -0,0 +1,29 @@
+import numpy as np
+
+from function import Function
+from main import functions, runge_integration
+from methods.adaptive_simpson import adaptive_integration
+from methods.simpson_method import SimpsonMethod
+
+
+def compare(eps=1e-8):
+    """
+    Сколько вычислений f нужно равномерному Симпсону с правилом Рунге и адаптивному Симпсону.
+    """
+    cases = [(f, 0.0, 2.0) for f in functions.values()] + [
+        (Function(lambda x: np.sqrt(x), "f(x) = sqrt(x)"), 0.0, 1.0),
+        (Function(lambda x: 1 / (1e-4 + (x - 0.3) ** 2), "f(x) = 1 / (1e-4 + (x - 0.3)^2)"), 0.0, 1.0),
+        (Function(lambda x: np.sin(1 / x), "f(x) = sin(1/x)"), 0.05, 1.0),
+    ]
+    print(f"{'функция':<36} {'Рунге I':>18} {'вычислений':>11} {'адаптивный I':>18} {'вычислений':>11}")
+    for f, a, b in cases:
+        f.reset()
+        uniform, _ = runge_integration(SimpsonMethod(), f, a, b, eps)
+        uniform_evaluations = f.evaluations
+        f.reset()
+        adaptive, _ = adaptive_integration(f, a, b, eps)
+        print(f"{f.description:<36} {uniform:>18.10f} {uniform_evaluations:>11} {adaptive:>18.10f} {f.evaluations:>11}")
+
+
+if __name__ == "__main__":
+    compare()
@@ -0,0 +1,151 @@
+import argparse
+import math
+import multiprocessing as mp
+import time
+
+import numpy as np
+from scipy.stats import qmc
+
+from methods import node_sum
+from methods.gauss_method import GaussLegendreMethod
+from methods.simpson_method import SimpsonMethod
+
+# Кратные интегралы по прямоугольному параллелепипеду [lows[0], highs[0]] x ... x [lows[d-1], highs[d-1]].
+# Функция принимает d аргументов: f(x, y) для d = 2, f(x1, ..., x6) для d = 6,
+# и, как и в одномерном случае, лучше если умеет работать с массивами.
+
+
+def evaluate_nd(f, points):
+    """
+    Значения f в точках points (массив m x d): одним вызовом на столбцах, иначе по точке.
+    """
+    try:
+        return np.array(np.broadcast_to(np.asarray(f(*points.T), dtype=float), points.shape[:1]))
+    except (TypeError, ValueError):
+        return np.array([f(*p) for p in points], dtype=float)
+
+
+def tensor_integrate(method_obj, f, lows, highs, n):
+    """
+    Тензорное произведение одномерных правил: по каждой оси узлы и веса method_obj.nodes_weights
+    с n разбиениями, вес точки — произведение весов по осям.
+    Всю сетку (число точек — произведение по осям) в память не кладём: идём по плоскому номеру
+    точки кусками по node_sum.CHUNK и восстанавливаем координаты через unravel_index.
+    """
+    axes = [method_obj.nodes_weights(lo, hi, n) for lo, hi in zip(lows, highs)]
+    shape = tuple(len(x) for x, _ in axes)
+    total = math.prod(shape)
+
+    s = 0.0
+    for start in range(0, total, node_sum.CHUNK):
+        idx = np.unravel_index(np.arange(start, min(start + node_sum.CHUNK, total)), shape)
+        points = np.column_stack([x[i] for (x, _), i in zip(axes, idx)])
+        weights = np.prod([w[i] for (_, w), i in zip(axes, idx)], axis=0)
+        s += float(evaluate_nd(f, points) @ weights)
+    return s
+
+
+def tensor_runge(method_obj, f, lows, highs, eps, n=2, max_points=10 ** 8):
+    """
+    Правило Рунге для тензорной кубатуры: удваиваем n по всем осям, пока
+    |I_2n - I_n| / (2^p - 1) >= eps или пока точек не станет больше max_points.
+    Возвращает (I, n).
+    """
+    R = 2 ** method_obj.order - 1
+    I_prev = tensor_integrate(method_obj, f, lows, highs, n)
+    while True:
+        n *= 2
+        I_curr = tensor_integrate(method_obj, f, lows, highs, n)
+        if abs(I_curr - I_prev) / R < eps:
+            return I_curr, n
+        if len(method_obj.nodes_weights(0.0, 1.0, 2 * n)[0]) ** len(lows) > max_points:
+            print(f"Тензорная кубатура: при n = {n} точность {eps} не достигнута, сетка дальше слишком большая")
+            return I_curr, n
+        I_prev = I_curr
+
+
+# Функция для процессов-воркеров QMC: достаётся после fork из памяти родителя (лямбды не сериализуются)
+_qmc_function = None
+
+
+def _qmc_replicate(task):
+    """
+    Одна рандомизация: свой скремблированный Sobol/Halton, 2^m точек, среднее значение f.
+    Точки генерируются и считаются кусками, чтобы не держать в памяти все сразу.
+    """
+    f, kind, m, lows, highs, seed = task
+    f = f or _qmc_function
+    d, rng = len(lows), np.random.default_rng(seed)
+    sampler = qmc.Sobol(d, scramble=True, seed=rng) if kind == 'sobol' else qmc.Halton(d, scramble=True, seed=rng)
+    count = 2 ** m
+    s = 0.0
+    for start in range(0, count, node_sum.CHUNK):
+        points = qmc.scale(sampler.random(min(node_sum.CHUNK, count - start)), lows, highs)
+        s += float(evaluate_nd(f, points).sum())
+    return s / count
+
+
+def qmc_integrate(f, lows, highs, m=14, replicates=8, kind='sobol', workers=1, seed=None):
+    """
+    Квази-Монте-Карло: replicates независимых скремблирований по 2^m точек.
+    Интеграл — среднее по повторам, умноженное на объём; погрешность оценивается
+    по разбросу повторов: std / sqrt(replicates) (обычная оценка для рандомизированного QMC).
+    Повторы можно считать на workers процессах — каждый сам генерирует свои точки.
+    Возвращает (I, оценка погрешности, число вычислений f).
+    """
+    global _qmc_function
+    if kind not in ('sobol', 'halton'):
+        raise ValueError("kind должен быть 'sobol' или 'halton'")
+    lows, highs = np.asarray(lows, dtype=float), np.asarray(highs, dtype=float)
+    volume = float(np.prod(highs - lows))
+    seeds = np.random.SeedSequence(seed).spawn(replicates)
+
+    if workers > 1 and 'fork' in mp.get_all_start_methods():
+        _qmc_function = f
+        try:
+            with mp.get_context('fork').Pool(workers) as pool:
+                means = pool.map(_qmc_replicate, [(None, kind, m, lows, highs, s) for s in seeds])
+        finally:
+            _qmc_function = None
+    else:
+        means = [_qmc_replicate((f, kind, m, lows, highs, s)) for s in seeds]
+
+    means = np.array(means) * volume
+    error = float(means.std(ddof=1) / math.sqrt(replicates)) if replicates > 1 else math.inf
+    return float(means.mean()), error, replicates * 2 ** m
+
+
+def _demo_function(*xs):
+    """
+    Тестовая функция: prod cos(x_i), интеграл по [0, 1]^d равен sin(1)^d.
+    """
+    return np.prod([np.cos(x) for x in xs], axis=0)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Кратные интегралы: тензорные правила и квази-Монте-Карло")
+    parser.add_argument("--dims", type=int, nargs="+", default=[2, 3, 4, 5, 6], help="размерности")
+    parser.add_argument("--eps", type=float, default=1e-6, help="точность для тензорных правил")
+    parser.add_argument("-m", type=int, default=14, help="2^m точек в одном повторе QMC")
+    parser.add_argument("--replicates", type=int, default=8, help="число повторов QMC")
+    parser.add_argument("-w", "--workers", type=int, default=1, help="процессов для QMC")
+    args = parser.parse_args()
+
+    print("f = prod cos(x_i) на [0, 1]^d, точное значение sin(1)^d")
+    print(f"{'d':>2} {'метод':<16} {'интеграл':>16} {'погрешность':>12} {'оценка':>10} {'точек':>10} {'время, с':>9}")
+    for d in args.dims:
+        exact = math.sin(1) ** d
+        lows, highs = [0.0] * d, [1.0] * d
+        for name, method_obj in (("Симпсон", SimpsonMethod()), ("Гаусс, 3 узла", GaussLegendreMethod(3))):
+            start = time.perf_counter()
+            value, n = tensor_runge(method_obj, _demo_function, lows, highs, args.eps)
+            elapsed = time.perf_counter() - start
+            points = len(method_obj.nodes_weights(0.0, 1.0, n)[0]) ** d
+            print(f"{d:>2} {name:<16} {value:>16.12f} {abs(value - exact):>12.2e} {'':>10} {points:>10} {elapsed:>9.3f}")
+        for kind in ("sobol", "halton"):
+            start = time.perf_counter()
+            value, error, points = qmc_integrate(_demo_function, lows, highs, args.m, args.replicates, kind,
+                                                 args.workers, seed=1)
+            elapsed = time.perf_counter() - start
+            print(f"{d:>2} {'QMC ' + kind:<16} {value:>16.12f} {abs(value - exact):>12.2e} {error:>10.1e} "
+                  f"{points:>10} {elapsed:>9.3f}")
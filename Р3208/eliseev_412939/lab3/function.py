@@ -1,15 +1,26 @@
+import numpy as np
+
+
 class Function:
     """
     Класс для хранения функции (лямбда-выражение) и её описания.
+    Считает, в скольких точках её вычислили (evaluations), — вызов на массиве
+    считается за столько вычислений, сколько в нём элементов.
     """
 
     def __init__(self, function, description):
         self.function = function
         self.description = description
+        self.evaluations = 0
 
     def __call__(self, x):
         """
         Позволяет вызывать экземпляр класса как функцию:
         f_obj(x) эквивалентно f_obj.function(x)
         """
-        return self.function(x)
\ No newline at end of file
+        y = self.function(x)
+        self.evaluations += np.size(x)
+        return y
+
+    def reset(self):
+        self.evaluations = 0
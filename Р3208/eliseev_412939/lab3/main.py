@@ -1,4 +1,7 @@
 from function import Function
+from methods.adaptive_simpson import adaptive_integration
+from methods.gauss_method import ClenshawCurtisMethod, GaussLegendreMethod
+from methods.nested_grid import NestedGrid
 from methods.rectangle_method import RectangleMethod
 from methods.simpson_method import SimpsonMethod
 from methods.trapezoid_method import TrapezoidMethod
@@ -21,22 +24,40 @@ functions = {
 }
 
 
-def runge_integration(method_obj, f, a, b, eps):
+def runge_integration(method_obj, f, a, b, eps, n_max=2 ** 24):
     """
     Адаптивное интегрирование с использованием правила Рунге:
     method_obj  - объект класса (RectangleMethod / TrapezoidMethod / SimpsonMethod)
                   который имеет:
                   * метод .integrate(f, a, b, n)
                   * атрибут .order (порядок точности p)
+                  * (необязательно) метод .nested(grid) — тогда сетка дробится
+                    через NestedGrid и f считается только в новых узлах
     f           - функция (экземпляр MathFunction или любая callable)
     a, b        - пределы интегрирования
     eps         - требуемая точность
+    n_max       - больше стольких разбиений не берём (иначе для плохой f цикл не кончится)
     Возвращает (I, n), где I - значение интеграла, n - использованное число разбиений.
     """
     p = method_obj.order
     R = 2 ** p - 1  # Коэффициент Рунге
     n = 4  # Начальное число разбиений
 
+    if hasattr(method_obj, 'nested'):
+        # Симпсону на n отрезках нужна сетка из n/2 (её середины — нечётные узлы)
+        grid = NestedGrid(f, a, b, n // 2 if isinstance(method_obj, SimpsonMethod) else n)
+        I_prev, n = method_obj.nested(grid)
+        while True:
+            grid.refine()
+            I_curr, n = method_obj.nested(grid)
+            error_est = abs(I_curr - I_prev) / R
+            if error_est < eps:
+                return I_curr, n
+            if n >= n_max:
+                print(f"Правило Рунге: при n = {n} оценка погрешности {error_est:.3e} ещё больше eps")
+                return I_curr, n
+            I_prev = I_curr
+
     I_prev = method_obj.integrate(f, a, b, n)
 
     while True:
@@ -45,9 +66,36 @@ def runge_integration(method_obj, f, a, b, eps):
         error_est = abs(I_curr - I_prev) / R
         if error_est < eps:
             return I_curr, n
+        if n >= n_max:
+            print(f"Правило Рунге: при n = {n} оценка погрешности {error_est:.3e} ещё больше eps")
+            return I_curr, n
         I_prev = I_curr
 
 
+def romberg_integration(f, a, b, eps, max_levels=30):
+    """
+    Метод Ромберга: трапеции на вложенных сетках (каждое значение f считается один раз)
+    и экстраполяция Ричардсона по строкам таблицы
+        R[k][j] = R[k][j-1] + (R[k][j-1] - R[k-1][j-1]) / (4^j - 1)
+    Останавливаемся, когда диагональные элементы двух соседних строк отличаются меньше чем на eps.
+    Возвращает (I, n), где n - число разбиений последней сетки.
+    """
+    grid = NestedGrid(f, a, b, 1)
+    prev_row = [grid.trapezoid()]
+
+    for k in range(1, max_levels + 1):
+        grid.refine()
+        row = [grid.trapezoid()]
+        for j in range(1, k + 1):
+            row.append(row[j - 1] + (row[j - 1] - prev_row[j - 1]) / (4 ** j - 1))
+        if abs(row[-1] - prev_row[-1]) < eps:
+            return row[-1], grid.m
+        prev_row = row
+
+    print(f"Ромберг: за {max_levels} уровней точность {eps} не достигнута")
+    return prev_row[-1], grid.m
+
+
 def main():
     print("Выберите функцию для интегрирования:")
     for num, mf in functions.items():
@@ -66,6 +114,10 @@ def main():
     print("3 - Метод средних прямоугольников")
     print("4 - Метод трапеций")
     print("5 - Метод Симпсона")
+    print("6 - Метод Ромберга (трапеции + экстраполяция Ричардсона)")
+    print("7 - Адаптивный метод Симпсона (дробятся только плохие отрезки)")
+    print("8 - Метод Гаусса-Лежандра (3 узла на отрезке)")
+    print("9 - Метод Кленшоу-Кёртиса (5 узлов на отрезке)")
     method_choice = int(input("Введите номер метода: "))
 
     # Создаём объект соответствующего метода
@@ -84,6 +136,18 @@ def main():
     elif method_choice == 5:
         method_obj = SimpsonMethod()
         method_name = "Симпсон"
+    elif method_choice == 6:
+        method_obj = None
+        method_name = "Ромберг"
+    elif method_choice == 7:
+        method_obj = None
+        method_name = "Адаптивный Симпсон"
+    elif method_choice == 8:
+        method_obj = GaussLegendreMethod(points=3)
+        method_name = "Гаусс-Лежандр"
+    elif method_choice == 9:
+        method_obj = ClenshawCurtisMethod(points=5)
+        method_name = "Кленшоу-Кёртис"
     else:
         print("Неверный выбор метода. Завершаем.")
         return
@@ -97,12 +161,19 @@ def main():
     eps = float(input("\nВведите требуемую точность eps: "))
 
     # Выполняем интегрирование с правилом Рунге
-    result, n_final = runge_integration(method_obj, f, a, b, eps)
+    f.reset()
+    if method_choice == 6:
+        result, n_final = romberg_integration(f, a, b, eps)
+    elif method_choice == 7:
+        result, n_final = adaptive_integration(f, a, b, eps)
+    else:
+        result, n_final = runge_integration(method_obj, f, a, b, eps)
 
     print(f"\nРезультаты вычисления методом: {method_name}")
     print(f"Функция: {f.description}")
     print(f"Интеграл на отрезке [{a}; {b}] ≈ {result:.8f}")
     print(f"Достигнуто при числе разбиений n = {n_final}")
+    print(f"Вычислений функции: {f.evaluations}")
     print(f"Заданная точность: eps = {eps}")
 
 
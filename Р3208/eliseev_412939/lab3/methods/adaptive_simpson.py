@@ -0,0 +1,80 @@
+import heapq
+
+import numpy as np
+
+from methods.node_sum import evaluate
+
+
+def _simpson(fa, fm, fb, h):
+    return (fa + 4 * fm + fb) * h / 6
+
+
+def adaptive_integration(f, a, b, eps, max_evaluations=10 ** 6, start=4, batch=64):
+    """
+    Адаптивный метод Симпсона: дробим не весь [a, b], а только те отрезки, где локальная
+    оценка погрешности |S(левая половина) + S(правая) - S(целый)| / 15 больше их доли eps,
+    т.е. eps * (длина отрезка) / (b - a).
+    Отрезки лежат в куче по "плотности" погрешности (оценка / длина): сверху — самый плохой.
+    За один проход снимаем до batch плохих отрезков и считаем f в их новых точках одним вызовом.
+    Останавливаемся, когда плохих отрезков нет или кончился бюджет max_evaluations.
+    Возвращает (I, n), где n - итоговое число элементарных отрезков (как у Симпсона).
+    """
+    if a > b:
+        # ключ кучи (погрешность / длина) при h < 0 поменял бы знак — считаем на [b, a]
+        value, n = adaptive_integration(f, b, a, eps, max_evaluations, start, batch)
+        return -value, n
+    if a == b:
+        return 0.0, 0
+    length = b - a
+    # начальные отрезки: концы, середины и четверти считаем одним массивом
+    x = np.linspace(a, b, 4 * start + 1)
+    y = evaluate(f, x)
+    evaluations = x.size
+
+    heap = []
+    for i in range(start):
+        x0, h = x[4 * i], x[4 * i + 4] - x[4 * i]
+        y0, y1, y2, y3, y4 = y[4 * i:4 * i + 5]
+        _push(heap, x0, h, y0, y1, y2, y3, y4)
+
+    while heap and evaluations < max_evaluations:
+        bad = []
+        limit = min(batch, (max_evaluations - evaluations) // 4)  # 4 новые точки на отрезок
+        while heap and len(bad) < limit and -heap[0][0] * length > eps:
+            bad.append(heapq.heappop(heap))
+        if not bad:
+            break
+
+        # в каждой половинке нужны две новые четверти
+        x0 = np.array([item[1] for item in bad])
+        h = np.array([item[2] for item in bad])
+        new_x = np.concatenate([x0 + h / 8, x0 + 3 * h / 8, x0 + 5 * h / 8, x0 + 7 * h / 8])
+        new_y = evaluate(f, new_x).reshape(4, len(bad))
+        evaluations += new_x.size
+
+        for k, (_, x0k, hk, y0, y1, y2, y3, y4) in enumerate(bad):
+            _push(heap, x0k, hk / 2, y0, new_y[0, k], y1, new_y[1, k], y2)
+            _push(heap, x0k + hk / 2, hk / 2, y2, new_y[2, k], y3, new_y[3, k], y4)
+
+    error = sum(-item[0] * item[2] for item in heap)
+    if error > eps:
+        print(f"Адаптивный Симпсон: бюджет {max_evaluations} вычислений исчерпан, оценка погрешности {error:.3e}")
+
+    # на каждом отрезке — две половинки Симпсона плюс поправка Ричардсона
+    total = 0.0
+    for _, x0, h, y0, y1, y2, y3, y4 in heap:
+        whole = _simpson(y0, y2, y4, h)
+        halves = _simpson(y0, y1, y2, h / 2) + _simpson(y2, y3, y4, h / 2)
+        total += halves + (halves - whole) / 15
+    return float(total), 4 * len(heap)
+
+
+def _push(heap, x0, h, y0, y1, y2, y3, y4):
+    """
+    Кладёт отрезок [x0, x0 + h] со значениями в концах, середине и четвертях.
+    Ключ — минус оценка погрешности на единицу длины (heapq — куча минимумов).
+    """
+    whole = _simpson(y0, y2, y4, h)
+    halves = _simpson(y0, y1, y2, h / 2) + _simpson(y2, y3, y4, h / 2)
+    density = abs(halves - whole) / 15 / h
+    heapq.heappush(heap, (-density, x0, h, y0, y1, y2, y3, y4))
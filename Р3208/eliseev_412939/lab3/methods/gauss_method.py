@@ -0,0 +1,69 @@
+import numpy as np
+
+from methods import node_sum
+from methods.node_tables import node_table
+
+
+class CompositeRuleMethod:
+    """
+    Составная квадратура: [a, b] делится на n отрезков, на каждом — правило с таблицей
+    узлов и весов на [-1, 1] (kind, points). Узлы всех отрезков строятся одним массивом
+    (кусками не больше node_sum.CHUNK узлов), f вызывается на весь кусок.
+    """
+    kind = None
+
+    def __init__(self, points, cache_dir=None):
+        self.points = points
+        self.cache_dir = cache_dir
+
+    def table(self):
+        return node_table(self.kind, self.points, self.cache_dir)
+
+    def integrate(self, f, a, b, n):
+        t, w = self.table()
+        h = (b - a) / n
+        offsets = (t + 1) * h / 2  # узлы внутри одного отрезка
+        per_chunk = max(1, node_sum.CHUNK // self.points)
+
+        s = 0.0
+        for lo in range(0, n, per_chunk):
+            hi = min(lo + per_chunk, n)
+            x = (a + np.arange(lo, hi, dtype=float) * h)[:, None] + offsets
+            s += float((node_sum.evaluate(f, x) @ w).sum())
+        return s * h / 2
+
+    def nodes_weights(self, a, b, n):
+        """
+        Узлы и веса составного правила на [a, b] (для тензорных кубатур).
+        """
+        t, w = self.table()
+        h = (b - a) / n
+        x = (a + np.arange(n) * h)[:, None] + (t + 1) * h / 2
+        return x.ravel(), np.tile(w * h / 2, n)
+
+
+class GaussLegendreMethod(CompositeRuleMethod):
+    """
+    Составной метод Гаусса-Лежандра с points узлами на отрезке.
+    Точен для многочленов степени 2*points - 1, порядок точности p = 2 * points.
+    """
+    kind = 'legendre'
+
+    def __init__(self, points=3, cache_dir=None):
+        super().__init__(points, cache_dir)
+        self.order = 2 * points
+
+
+class ClenshawCurtisMethod(CompositeRuleMethod):
+    """
+    Составной метод Кленшоу-Кёртиса с points узлами (включая концы) на отрезке.
+    Точен для многочленов степени points - 1 (points при нечётном points, по симметрии),
+    порядок точности на единицу больше.
+    """
+    kind = 'clenshaw_curtis'
+
+    def __init__(self, points=5, cache_dir=None):
+        if points < 2:
+            raise ValueError("для Кленшоу-Кёртиса нужно хотя бы 2 узла")
+        super().__init__(points, cache_dir)
+        self.order = points + 1 if points % 2 else points
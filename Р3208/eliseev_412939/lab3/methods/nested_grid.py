@@ -0,0 +1,58 @@
+from methods.node_sum import node_sum
+
+
+class NestedGrid:
+    """
+    Равномерная сетка на [a, b] из m отрезков, которую можно дробить пополам, не теряя
+    уже посчитанных значений f. Храним только суммы:
+      f_a, f_b — значения на концах
+      interior — сумма f во внутренних узлах сетки
+      mids     — сумма f в серединах отрезков (это ровно новые узлы следующего уровня),
+                 считается только когда понадобится
+    Из этих сумм получаются прямоугольники, трапеции и Симпсон (см. nested() у методов).
+    При refine() середины становятся внутренними узлами, и считаются только новые середины.
+    """
+
+    def __init__(self, f, a, b, m=1):
+        self.f = f
+        self.a, self.b = a, b
+        self.m = m
+        self.h = (b - a) / m
+        self.f_a, self.f_b = f(a), f(b)
+        self.interior = node_sum(f, a + self.h, self.h, m - 1)
+        self.evaluations = m + 1
+        self._mids = None
+
+    @property
+    def mids(self):
+        if self._mids is None:
+            self._mids = node_sum(self.f, self.a + self.h / 2, self.h, self.m)
+            self.evaluations += self.m
+        return self._mids
+
+    def refine(self):
+        """
+        m -> 2m: считаем f только в m новых серединах.
+        """
+        self.interior += self.mids
+        self.m *= 2
+        self.h /= 2
+        self._mids = None
+
+    def left(self):
+        return (self.f_a + self.interior) * self.h
+
+    def right(self):
+        return (self.interior + self.f_b) * self.h
+
+    def trapezoid(self):
+        return (0.5 * (self.f_a + self.f_b) + self.interior) * self.h
+
+    def middle(self):
+        return self.mids * self.h
+
+    def simpson(self):
+        """
+        Симпсон на 2m отрезках: середины — нечётные узлы (вес 4), узлы сетки — чётные (вес 2).
+        """
+        return (self.f_a + self.f_b + 2 * self.interior + 4 * self.mids) * self.h / 6
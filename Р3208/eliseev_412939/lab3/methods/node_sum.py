@@ -0,0 +1,50 @@
+import numpy as np
+
+# Сколько узлов считаем за раз: память ограничена примерно CHUNK * 8 байт на массив
+CHUNK = 1 << 20
+
+
+def scalar_sum(f, start, step, count):
+    """
+    Сумма f(start + k * step), k = 0..count-1, обычным циклом — для функций,
+    которые не умеют работать с массивами (math.sin, if внутри лямбды и т.п.).
+    Узел считается через k, а не прибавлением h, чтобы не накапливалась ошибка.
+    """
+    s = 0.0
+    for k in range(count):
+        s += f(start + k * step)
+    return s
+
+
+def node_sum(f, start, step, count, chunk=None):
+    """
+    Сумма f(start + k * step), k = 0..count-1.
+    Узлы строятся массивом и f вызывается сразу на весь кусок из chunk узлов,
+    так что память не зависит от count. Если f не принимает массив, считаем циклом.
+    """
+    if count <= 0:
+        return 0.0
+    chunk = chunk or CHUNK
+
+    s = 0.0
+    for lo in range(0, count, chunk):
+        hi = min(lo + chunk, count)
+        x = start + np.arange(lo, hi, dtype=float) * step
+        try:
+            y = np.broadcast_to(np.asarray(f(x), dtype=float), x.shape)
+        except (TypeError, ValueError):
+            # f не векторизуется — остаток досчитываем по одному узлу
+            return s + scalar_sum(f, start + lo * step, step, count - lo)
+        s += float(y.sum())
+    return s
+
+
+def evaluate(f, x):
+    """
+    Значения f в узлах x одним вызовом на массиве, а если f так не умеет — по одному.
+    """
+    x = np.asarray(x, dtype=float)
+    try:
+        return np.array(np.broadcast_to(np.asarray(f(x), dtype=float), x.shape))
+    except (TypeError, ValueError):
+        return np.array([f(float(xi)) for xi in x.ravel()], dtype=float).reshape(x.shape)
@@ -0,0 +1,67 @@
+import os
+
+import numpy as np
+
+# Таблицы узлов и весов на [-1, 1]. Считаются один раз на каждое число узлов и хранятся
+# в памяти; если указать cache_dir, то ещё и на диске (файл <вид>_<число узлов>.npz),
+# чтобы следующий запуск программы их уже не пересчитывал.
+_tables = {}
+
+
+def legendre_nodes(k):
+    """
+    Узлы и веса Гаусса-Лежандра с k узлами (точно для многочленов степени 2k - 1).
+    """
+    return np.polynomial.legendre.leggauss(k)
+
+
+def clenshaw_curtis_nodes(k):
+    """
+    Узлы Кленшоу-Кёртиса x_j = cos(pi j / N), j = 0..N, N = k - 1, и веса по явной формуле
+        w_j = c_j / N * (1 - sum_{m=1}^{N/2} b_m cos(2 m j pi / N) / (4 m^2 - 1)),
+    где c_0 = c_N = 1, остальные 2; b_m = 1 при m = N/2, иначе 2.
+    """
+    if k < 2:
+        raise ValueError("для Кленшоу-Кёртиса нужно хотя бы 2 узла")
+    N = k - 1
+    theta = np.pi * np.arange(N + 1) / N
+    m = np.arange(1, N // 2 + 1)
+    b = np.where(2 * m == N, 1.0, 2.0)
+    s = (b / (4 * m ** 2 - 1)) @ np.cos(2 * np.outer(m, theta))
+    c = np.full(N + 1, 2.0)
+    c[[0, N]] = 1.0
+    weights = c / N * (1 - s)
+    # узлы по возрастанию, как у Гаусса
+    return np.cos(theta)[::-1].copy(), weights[::-1].copy()
+
+
+_builders = {
+    'legendre': legendre_nodes,
+    'clenshaw_curtis': clenshaw_curtis_nodes,
+}
+
+
+def node_table(kind, k, cache_dir=None):
+    """
+    (узлы, веса) правила kind с k узлами: из памяти, с диска или посчитанные заново.
+    """
+    key = (kind, k)
+    if key in _tables:
+        return _tables[key]
+
+    path = os.path.join(cache_dir, f"{kind}_{k}.npz") if cache_dir else None
+    if path and os.path.exists(path):
+        with np.load(path) as data:
+            table = data["nodes"], data["weights"]
+    else:
+        table = _builders[kind](k)
+        if path:
+            os.makedirs(cache_dir, exist_ok=True)
+            np.savez(path, nodes=table[0], weights=table[1])
+
+    _tables[key] = table
+    return table
+
+
+def clear_tables():
+    _tables.clear()
@@ -1,3 +1,8 @@
+import numpy as np
+
+from methods.node_sum import node_sum
+
+
 class RectangleMethod:
     """
     Класс для численного интегрирования методом прямоугольников.
@@ -24,24 +29,33 @@ class RectangleMethod:
         """
         Вычисление интеграла от a до b методом прямоугольников,
         с учётом выбранного режима (left / right / middle).
+        Все узлы одного вида, поэтому это просто сумма f по узлам, умноженная на h.
         """
         h = (b - a) / n
-        s = 0.0
         if self.mode == 'left':
-            x = a
-            for _ in range(n):
-                s += f(x)
-                x += h
+            start = a
         elif self.mode == 'right':
-            x = a + h
-            for _ in range(n):
-                s += f(x)
-                x += h
+            start = a + h
         else:  # 'middle'
-            x = a
-            for _ in range(n):
-                mid = x + h / 2
-                s += f(mid)
-                x += h
+            start = a + h / 2
 
-        return s * h
\ No newline at end of file
+        return node_sum(f, start, h, n) * h
+
+    def nested(self, grid):
+        """
+        Значение по суммам вложенной сетки (NestedGrid) без новых вычислений f.
+        :return: (I, n) — как integrate(f, a, b, n) при n = grid.m
+        """
+        if self.mode == 'left':
+            return grid.left(), grid.m
+        if self.mode == 'right':
+            return grid.right(), grid.m
+        return grid.middle(), grid.m
+
+    def nodes_weights(self, a, b, n):
+        """
+        Узлы и веса составного правила на [a, b] (для тензорных кубатур).
+        """
+        h = (b - a) / n
+        shift = {'left': 0.0, 'right': h, 'middle': h / 2}[self.mode]
+        return a + shift + np.arange(n) * h, np.full(n, h)
@@ -1,3 +1,8 @@
+import numpy as np
+
+from methods.node_sum import node_sum
+
+
 class SimpsonMethod:
     """
     Класс для численного интегрирования методом Симпсона.
@@ -16,14 +21,25 @@ class SimpsonMethod:
             n += 1  # делаем n чётным
         h = (b - a) / n
         s = f(a) + f(b)
-        s_odd = 0.0  # сумма f на нечётных узлах
-        s_even = 0.0  # сумма f на чётных узлах
+        s_odd = node_sum(f, a + h, 2 * h, n // 2)  # сумма f на нечётных узлах (вес 4)
+        s_even = node_sum(f, a + 2 * h, 2 * h, n // 2 - 1)  # сумма f на чётных узлах (вес 2)
 
-        for k in range(1, n):
-            xk = a + k * h
-            if k % 2 == 0:
-                s_even += f(xk)
-            else:
-                s_odd += f(xk)
+        return (s + 2 * s_even + 4 * s_odd) * h / 3.0
 
-        return (s + 2 * s_even + 4 * s_odd) * h / 3.0
\ No newline at end of file
+    def nested(self, grid):
+        """
+        Значение по суммам вложенной сетки (NestedGrid): середины сетки из m отрезков —
+        нечётные узлы Симпсона на n = 2m отрезках.
+        """
+        return grid.simpson(), 2 * grid.m
+
+    def nodes_weights(self, a, b, n):
+        """
+        Узлы и веса составного правила на [a, b] (для тензорных кубатур): h/3 * (1, 4, 2, ..., 4, 1).
+        """
+        if n % 2 != 0:
+            n += 1
+        h = (b - a) / n
+        weights = np.where(np.arange(n + 1) % 2 == 1, 4.0, 2.0)
+        weights[[0, -1]] = 1.0
+        return a + np.arange(n + 1) * h, weights * h / 3
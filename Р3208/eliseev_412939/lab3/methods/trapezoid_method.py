@@ -1,3 +1,8 @@
+import numpy as np
+
+from methods.node_sum import node_sum
+
+
 class TrapezoidMethod:
     """
     Класс для численного интегрирования методом трапеций.
@@ -10,8 +15,20 @@ class TrapezoidMethod:
     def integrate(self, f, a, b, n):
         h = (b - a) / n
         s = 0.5 * (f(a) + f(b))  # полусумма значений на краях
-        x = a + h
-        for _ in range(n - 1):
-            s += f(x)
-            x += h
-        return s * h
\ No newline at end of file
+        s += node_sum(f, a + h, h, n - 1)  # внутренние узлы с весом 1
+        return s * h
+
+    def nested(self, grid):
+        """
+        Значение по суммам вложенной сетки (NestedGrid): (I, n) при n = grid.m.
+        """
+        return grid.trapezoid(), grid.m
+
+    def nodes_weights(self, a, b, n):
+        """
+        Узлы и веса составного правила на [a, b] (для тензорных кубатур).
+        """
+        h = (b - a) / n
+        weights = np.full(n + 1, h)
+        weights[[0, -1]] = h / 2
+        return a + np.arange(n + 1) * h, weights
@@ -1,5 +1,6 @@
 import numpy as np
 import matplotlib.pyplot as plt
+from scipy.linalg import solve_triangular
 import argparse
 import sys
 
@@ -39,7 +40,7 @@ def eval_model(x, coeffs, name):
     if name == 'linear':
         return coeffs[0] + coeffs[1]*x
     if name.startswith('poly'):
-        deg = int(name[-1])
+        deg = int(name[4:])
         return sum(coeffs[i]*x**i for i in range(deg+1))
     if name == 'exponential':
         A, B = coeffs
@@ -52,35 +53,77 @@ def eval_model(x, coeffs, name):
         return A * x**B
     raise ValueError(name)
 
+# Общий "движок" для всех моделей: одно QR-разложение матрицы Вандермонда [1, x, ..., x^max_deg].
+# У QR столбцы вложены: первые d+1 столбцов Q и левый верхний блок R — это QR для [1, x, ..., x^d],
+# поэтому любая степень <= max_deg получается из уже готового разложения решением треугольной системы.
+# Логарифмы x и y и базис [1, ln x] считаются один раз и общие для exponential, logarithmic и power.
+RCOND = 1e-12  # |R_ii| меньше RCOND * ||R|| считаем нулём (базис вырожден)
+
+
+class FitEngine:
+    def __init__(self, x, y, max_deg=3):
+        self.x, self.y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+        # линейная модель (и exponential через неё) нужна всегда, так что разложение хотя бы для [1, x]
+        self.max_deg = max(max_deg, 1)
+        self.V = basis_poly(self.x, self.max_deg)
+        self.Q, self.R = np.linalg.qr(self.V)
+        self._log = {}
+
+    def solve(self, P, Q, R, rhs, k):
+        # МНК по первым k столбцам: R[:k, :k] a = Q[:, :k]^T rhs.
+        # Если точек меньше k (у R меньше k строк) или базис вырожден (точек с разными x меньше k,
+        # на диагонали R почти нули) — тогда, как раньше, решение с минимальной нормой через lstsq
+        if k > R.shape[0] or np.min(np.abs(np.diag(R)[:k])) <= RCOND * np.linalg.norm(R[:k, :k]):
+            return fit_least_squares(P[:, :k], rhs)
+        return solve_triangular(R[:k, :k], Q[:, :k].T @ rhs)
+
+    def poly(self, deg, rhs=None):
+        if deg > self.max_deg:
+            raise ValueError(f"степень {deg} больше max_deg = {self.max_deg}")
+        return self.solve(self.V, self.Q, self.R, self.y if rhs is None else rhs, deg + 1)
+
+    def log(self, name):
+        # ln x, ln y и базис [1, ln x] с его QR — по требованию и один раз
+        if name not in self._log:
+            if name == 'x':
+                self._log[name] = np.log(self.x)
+            elif name == 'y':
+                self._log[name] = np.log(self.y)
+            else:  # 'basis'
+                P = basis_lin(self.log('x'))
+                self._log[name] = (P, *np.linalg.qr(P))
+        return self._log[name]
+
+    def exponential(self):
+        # ln y = ln A + B x: базис [1, x] — первые два столбца Вандермонда
+        a0, B = self.poly(1, self.log('y'))
+        return np.array([np.exp(a0), B])
+
+    def logarithmic(self):
+        return self.solve(*self.log('basis'), self.y, 2)
+
+    def power(self):
+        # ln y = ln A + B ln x
+        a0, B = self.solve(*self.log('basis'), self.log('y'), 2)
+        return np.array([np.exp(a0), B])
+
+
 # Аппроксимация каждой модели
-def fit_models(x, y):
-    results = {}
-    # Линейная
-    P = basis_lin(x)
-    a = fit_least_squares(P, y)
-    results['linear'] = a
-    # Полиномы 2-ой и 3-ей степени
-    for deg in [2, 3]:
-        P = basis_poly(x, deg)
-        results[f'poly{deg}'] = fit_least_squares(P, y)
+def fit_models(x, y, max_deg=3):
+    engine = FitEngine(x, y, max_deg)
+    results = {'linear': engine.poly(1)}
+    # Полиномы 2-ой, 3-ей и т.д. степени — из того же разложения
+    for deg in range(2, max_deg + 1):
+        results[f'poly{deg}'] = engine.poly(deg)
     # Экспоненциальная: ln y = ln A + B x
     if np.all(y > 0):
-        yp = np.log(y)
-        P = basis_lin(x)
-        ab = fit_least_squares(P, yp)
-        A, B = np.exp(ab[0]), ab[1]
-        results['exponential'] = np.array([A, B])
+        results['exponential'] = engine.exponential()
     # Логарифмическая: y = A + B ln x
     if np.all(x > 0):
-        P = np.vstack([np.ones_like(x), np.log(x)]).T
-        results['logarithmic'] = fit_least_squares(P, y)
+        results['logarithmic'] = engine.logarithmic()
     # Степенная: ln y = ln A + B ln x
     if np.all(x > 0) and np.all(y > 0):
-        xp, yp = np.log(x), np.log(y)
-        P = basis_lin(xp)
-        ab = fit_least_squares(P, yp)
-        A, B = np.exp(ab[0]), ab[1]
-        results['power'] = np.array([A, B])
+        results['power'] = engine.power()
     return results
 
 # Метрики качества
@@ -95,9 +138,10 @@ def compute_metrics(x, y, coeffs, name):
 if __name__ == '__main__':
     parser = argparse.ArgumentParser()
     parser.add_argument('-f', '--file', help='входной файл с двумя колонками: x y')
+    parser.add_argument('-d', '--max-deg', type=int, default=3, help='наибольшая степень многочлена')
     args = parser.parse_args()
     x, y = read_data(args.file)
-    models = fit_models(x, y)
+    models = fit_models(x, y, args.max_deg)
 
     stats = {}
     for name, coeffs in models.items():